@@ -1,12 +1,27 @@
+import argparse
+import os
 import random
-from turtle import Turtle, Screen
-import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.render import add_render_arguments, backend_from_args
+from gamekit.replay import new_seed
 
 is_race_on = False
 
-screen = Screen()
+parser = argparse.ArgumentParser(description="Bet on a turtle race")
+parser.add_argument("--seed", type=int, default=None, help="RNG seed, to rerun the exact same race")
+parser.add_argument("--bet", default=None, help="color to bet on instead of asking (needed headless)")
+add_render_arguments(parser)
+args = parser.parse_args()
+seed = args.seed if args.seed is not None else new_seed()
+race_rng = random.Random(seed)
+print(f"Race seed: {seed}")
+
+backend = backend_from_args(args)
+screen = backend.screen()
 screen.setup(width=500, height=400)
-user_bet = screen.textinput(title="Make your bet", prompt="Which turtle will win the race? Enter a color: ")
+user_bet = args.bet or screen.textinput(title="Make your bet", prompt="Which turtle will win the race? Enter a color: ")
 colors = ["red", "orange", "yellow", "green", "blue", "purple", "pink"]
 ## starting point needs to be -60
 y_positions = [(i * 30) - 90 for i in range(len(colors))] ###lets add first y position as -60
@@ -15,7 +30,7 @@ y_positions = [(i * 30) - 90 for i in range(len(colors))] ###lets add first y po
 all_turtles = []
 
 for turtle_index in range(len(colors)):
-    new_turtle = Turtle(shape="turtle")
+    new_turtle = backend.sprite("turtle")
     new_turtle.color(colors[turtle_index])
     new_turtle.penup()
     new_turtle.goto(x=-230, y=y_positions[turtle_index])
@@ -26,7 +41,7 @@ if user_bet:
 while is_race_on:
     for turtle in all_turtles:
        ###the turtle moves forward by random number between 0 and 10
-       random_distance = random.randint(0, 10)
+       random_distance = race_rng.randint(0, 10)
        turtle.forward(random_distance)
        if turtle.xcor() > 230:
            is_race_on = False
@@ -35,6 +50,7 @@ while is_race_on:
                print(f"You've won! The {winner_color} turtle is the winner!")
            else:
                print(f"You've lost! The {winner_color} turtle is the winner!")
+    screen.update()
            
 
 
@@ -1,58 +1,74 @@
 import os
 from openai import OpenAI
 from dotenv import load_dotenv
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from engine import heading_to_direction
+from llm_player import LLMSnakePlayer
+from prompt_encoding import STATIC_PROMPT, encode_state
 
 # Load environment variables
 load_dotenv()
 
-class AISnakePlayer:
-    def __init__(self):
-        api_key = os.getenv('OPENAI_API_KEY')
+
+def openai_base_url(server: Optional[str]) -> Optional[str]:
+    """The OpenAI SDK base URL for a server root such as a fake_llm_server.py instance"""
+    if not server:
+        return None
+    server = server.rstrip("/")
+    return server if server.endswith("/v1") else server + "/v1"
+
+
+class AISnakePlayer(LLMSnakePlayer):
+    def __init__(self, client=None, base_url: Optional[str] = None, **options):
+        super().__init__(**options)
+        self.model = "o4-mini"
+        if client is not None:
+            # e.g. an offline stub for benchmarks
+            self.client = client
+            return
+        # A base URL (e.g. fake_llm_server.py) can also come from the environment
+        base_url = base_url or os.getenv('OPENAI_BASE_URL')
+        api_key = os.getenv('OPENAI_API_KEY') or ("local" if base_url else None)
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        self.client = OpenAI(api_key=api_key)
-        self.model = "o4-mini"
-        self.moves_queue = []  # Store planned moves
+        self.client = OpenAI(api_key=api_key, base_url=base_url)
         
-    def get_ai_move(self, game_state: Dict[str, Any]) -> Optional[str]:
-        """Use OpenAI Responses API to get the next move for the snake"""
-        # If we have planned moves, use the next one
-        if self.moves_queue:
-            return self.moves_queue.pop(0)
-            
+    def request_plan(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        """Use OpenAI Responses API to plan the next moves for the snake"""
         try:
             response = self.client.responses.create(
                 model=self.model,
-                input=self.create_game_prompt(game_state)
+                input=self.build_prompt(game_state)
             )
             
-            # Parse the AI's response
-            moves = response.output_text.strip().upper().split()
-            
-            # Validate the moves
-            valid_moves = ["UP", "DOWN", "LEFT", "RIGHT"]
-            valid_sequence = [move for move in moves if move in valid_moves]
+            # Parse and validate the AI's response
+            valid_sequence = self.parse_moves(response.output_text)
             
             if valid_sequence:
-                # Store all moves except the first one
-                self.moves_queue = valid_sequence[1:]
-                return valid_sequence[0]
+                return valid_sequence
             else:
-                print(f"Invalid AI moves: {moves}")
+                print(f"Invalid AI moves: {response.output_text.upper().split()}")
                 return None
                 
         except Exception as e:
             print(f"OpenAI API Error: {e}")
             return None
     
+    def build_prompt(self, game_state: Dict[str, Any]) -> str:
+        """The prompt for the configured encoding"""
+        if self.encoding == "prose":
+            return self.create_game_prompt(game_state)
+        # Static text first, so OpenAI's prefix cache could reuse it once it reaches
+        # MIN_CACHEABLE_TOKENS (it is well short of that today)
+        return STATIC_PROMPT + "\n\n" + encode_state(game_state, self.encoding)
+
     def create_game_prompt(self, game_state: Dict[str, Any]) -> str:
         """Create a detailed prompt for the AI to make the best move"""
         snake_head = game_state['snake_head']
         food_pos = game_state['food_position']
         snake_body = game_state['snake_body']
-        current_dir = self.heading_to_direction(game_state['current_direction'])
+        current_dir = heading_to_direction(game_state['current_direction'])
         
         # Calculate distance to food
         dx = food_pos['x'] - snake_head['x']
@@ -90,12 +106,6 @@ STRATEGY TIPS:
 
 Respond with exactly 10 words separated by spaces: UP DOWN LEFT RIGHT (in the order you want to move)"""
 
-    def heading_to_direction(self, heading: float) -> str:
-        """Convert turtle heading degrees to readable direction"""
-        heading = int(heading % 360)
-        directions = {0: "RIGHT", 90: "UP", 180: "LEFT", 270: "DOWN"}
-        return directions.get(heading, f"ANGLE_{heading}")
-    
     def format_snake_body(self, snake_body: list) -> str:
         """Format snake body positions for better AI understanding"""
         if not snake_body:
@@ -134,4 +144,4 @@ Respond with exactly 10 words separated by spaces: UP DOWN LEFT RIGHT (in the or
         if safe_moves:
             return safe_moves[0]
         else:
-            return self.heading_to_direction(current_direction) 
\ No newline at end of file
+            return heading_to_direction(current_direction) 
\ No newline at end of file
@@ -0,0 +1,125 @@
+import numpy as np
+from engine import START_POSITIONS, MOVE_DISTANCE, GRID_SIZE
+
+# Action indices used by BatchSnakeEnv; -1 keeps the current heading
+ACTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+ACTION_INDEX = {name: index for index, name in enumerate(ACTIONS)}
+DX = np.array([0, 0, -1, 1], dtype=np.int64)
+DY = np.array([1, -1, 0, 0], dtype=np.int64)
+OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int64)
+
+# Cell values in the observation tensor
+EMPTY = 0
+BODY = 1
+HEAD = 2
+FOOD = 3
+
+
+class BatchSnakeEnv:
+    """N snake games advanced in lockstep with NumPy.
+
+    Follows the same rules as SnakeEngine: the snake starts on
+    START_POSITIONS heading right, reversals are ignored, the tail moves out
+    of the way before the self-collision test and eating grows the body by
+    one. Bodies are ring buffers of flat cell indices (row * width + col);
+    finished games stay frozen until reset().
+    """
+
+    def __init__(self, n, width=GRID_SIZE, height=GRID_SIZE, seed=None):
+        self.n = n
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.rng = np.random.default_rng(seed)
+        self.rows = np.arange(n)
+
+        self.body = np.zeros((n, self.cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.heading = np.zeros(n, dtype=np.int64)
+        self.occupied = np.zeros((n, self.cells), dtype=bool)
+        self.food = np.zeros(n, dtype=np.int64)  # -1 once the board is full, like SnakeEngine's None
+        self.score = np.zeros(n, dtype=np.int64)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.reset()
+
+    def reset(self, games=None):
+        """Restart the given games (a boolean mask or index array), or all"""
+        games = self.rows if games is None else self.rows[games]
+        if len(games) == 0:
+            return self.observe()
+
+        start = [(round(x / MOVE_DISTANCE) + self.width // 2) +
+                 (round(y / MOVE_DISTANCE) + self.height // 2) * self.width
+                 for x, y in START_POSITIONS]
+        # Ring buffer holds the tail first so the head sits at head_ptr
+        self.body[games, :len(start)] = start[::-1]
+        self.head_ptr[games] = len(start) - 1
+        self.length[games] = len(start)
+        self.heading[games] = ACTION_INDEX["RIGHT"]
+        self.occupied[games] = False
+        self.occupied[games[:, None], np.array(start)[None, :]] = True
+        self.score[games] = 0
+        self.steps[games] = 0
+        self.done[games] = False
+        self.place_food(games)
+        return self.observe()
+
+    def place_food(self, games):
+        """Pick a uniformly random free cell for each of the given games (-1 if none is free)"""
+        priority = self.rng.random((len(games), self.cells))
+        priority[self.occupied[games]] = -1.0
+        self.food[games] = np.where(priority.max(axis=1) >= 0, priority.argmax(axis=1), -1)
+
+    def step(self, actions):
+        """Advance every live game one tick.
+
+        actions holds one index into ACTIONS per game (or -1 to keep going).
+        Returns (observations, rewards, done) where rewards are 1 for food,
+        -1 for a crash and 0 otherwise.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        alive = ~self.done
+        turning = alive & (actions >= 0) & (actions != OPPOSITE[self.heading])
+        self.heading = np.where(turning, actions, self.heading)
+
+        head = self.body[self.rows, self.head_ptr]
+        col = head % self.width + DX[self.heading]
+        row = head // self.width + DY[self.heading]
+        outside = (col < 0) | (col >= self.width) | (row < 0) | (row >= self.height)
+        hit_wall = alive & outside
+        inside = alive & ~outside
+        new_head = np.where(inside, row * self.width + col, head)
+
+        ate = inside & (new_head == self.food)
+        popping = inside & ~ate
+        tail_ptr = (self.head_ptr - self.length + 1) % self.cells
+        tail = self.body[self.rows, tail_ptr]
+        self.occupied[self.rows[popping], tail[popping]] = False
+        self.length[popping] -= 1
+
+        hit_body = inside & self.occupied[self.rows, new_head]
+        moving = inside & ~hit_body
+        self.head_ptr[moving] = (self.head_ptr[moving] + 1) % self.cells
+        self.body[self.rows[moving], self.head_ptr[moving]] = new_head[moving]
+        self.occupied[self.rows[moving], new_head[moving]] = True
+        self.length[moving] += 1
+
+        self.steps[alive] += 1
+        self.score[ate] += 1
+        crashed = hit_wall | hit_body
+        self.done |= crashed
+        if ate.any():
+            self.place_food(self.rows[ate])
+
+        rewards = ate.astype(np.int8) - crashed.astype(np.int8)
+        return self.observe(), rewards, self.done.copy()
+
+    def observe(self):
+        """(N, height, width) int8 tensor of EMPTY/BODY/HEAD/FOOD cells"""
+        grid = self.occupied.astype(np.int8) * BODY
+        has_food = self.food >= 0
+        grid[self.rows[has_food], self.food[has_food]] = FOOD
+        grid[self.rows, self.body[self.rows, self.head_ptr]] = HEAD
+        return grid.reshape(self.n, self.height, self.width)
@@ -0,0 +1,102 @@
+import math
+from collections import Counter
+from typing import Dict, Any
+from engine import MOVE_DISTANCE, WALL_DISTANCE, DELTAS, OPPOSITES, centred_cell
+
+
+class AdaptiveCadence:
+    """Decides when an LLM player should ask for its next plan.
+
+    Keeps moving averages (EWMA) of request latency and its deviation, of the time between
+    decisions and of the length of validated plans. lead_moves() is how
+    many queued moves should still be left when the next request goes out
+    so that it lands just before the queue runs dry. horizon() caps how much
+    of a plan is trusted: the whole plan in open space, only a couple of
+    moves when a wall or the body is close ahead or to either side, which
+    makes the player replan sooner there.
+    """
+
+    def __init__(self, alpha=0.2, min_horizon=2, max_horizon=10, scan_radius=5):
+        self.alpha = alpha
+        self.min_horizon = min_horizon
+        self.max_horizon = max_horizon
+        self.scan_radius = scan_radius
+        self.latency = None  # seconds per plan request
+        self.deviation = 0.0  # mean absolute deviation of the latency
+        self.interval = None  # seconds between decisions
+        self.plan_length = None  # moves per validated plan
+        self.last_decision = None
+        self.leads = Counter()
+        self.horizons = Counter()
+
+    def average(self, current, sample):
+        return sample if current is None else current + self.alpha * (sample - current)
+
+    def observe_decision(self, now: float):
+        if self.last_decision is not None:
+            self.interval = self.average(self.interval, now - self.last_decision)
+        self.last_decision = now
+
+    def observe_latency(self, seconds: float):
+        if self.latency is not None:
+            self.deviation = self.average(self.deviation, abs(seconds - self.latency))
+        self.latency = self.average(self.latency, seconds)
+
+    def observe_plan(self, length: int):
+        self.plan_length = self.average(self.plan_length, length)
+
+    def lead_moves(self) -> int:
+        """Queued moves that cover a slow request (mean + 2 deviations), plus one spare"""
+        if self.latency is None or not self.interval:
+            lead = self.max_horizon // 2
+        else:
+            lead = math.ceil((self.latency + 2 * self.deviation) / self.interval) + 1
+        if self.plan_length is not None:
+            # Plans shorter than the lead can't hide the latency; ask as soon as one arrives
+            lead = min(lead, max(1, round(self.plan_length)))
+        return lead
+
+    def observe_request(self, lead: int):
+        """Count the lead a plan request actually went out with"""
+        self.leads[lead] += 1
+
+    def horizon(self, game_state: Dict[str, Any]) -> int:
+        """Plan moves to keep: twice the clearance around the head, clamped"""
+        horizon = max(self.min_horizon, min(self.max_horizon, 2 * self.clearance(game_state)))
+        self.horizons[horizon] += 1
+        return horizon
+
+    def clearance(self, game_state: Dict[str, Any]) -> int:
+        """Free cells ahead of the head in the most cramped direction it can turn to"""
+        head = game_state["snake_head"]
+        limit = game_state.get("screen_bounds", WALL_DISTANCE) // MOVE_DISTANCE
+        blocked = {centred_cell(seg["x"], seg["y"]) for seg in game_state["snake_body"]}
+        col, row = centred_cell(head["x"], head["y"])
+        heading = round(game_state["current_direction"]) % 360
+        clearance = self.scan_radius
+        for direction, (dx, dy) in DELTAS.items():
+            if direction == OPPOSITES.get(heading):
+                continue
+            free = 0
+            x, y = col + dx, row + dy
+            while (free < clearance and abs(x) <= limit and abs(y) <= limit
+                   and (x, y) not in blocked):
+                free += 1
+                x, y = x + dx, y + dy
+            clearance = free
+        return clearance
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "latency_ms": (self.latency or 0.0) * 1000,
+            "interval_ms": (self.interval or 0.0) * 1000,
+            "plan_length": self.plan_length or 0.0,
+            "leads": dict(sorted(self.leads.items())),
+            "horizons": dict(sorted(self.horizons.items())),
+        }
+
+    def stats(self) -> str:
+        summary = self.summary()
+        return (f"request {summary['latency_ms']:.0f}ms, decision every {summary['interval_ms']:.0f}ms, "
+                f"plans {summary['plan_length']:.1f} moves, "
+                f"lead {summary['leads']}, horizon {summary['horizons']}")
@@ -1,40 +1,55 @@
 import os
 import anthropic
 from dotenv import load_dotenv
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from engine import heading_to_direction
+from llm_player import LLMSnakePlayer
+from prompt_encoding import STATIC_PROMPT, encode_state, is_cacheable
 
 # Load environment variables
 load_dotenv()
 
-class ClaudeSnakePlayer:
-    def __init__(self):
-        api_key = os.getenv('ANTHROPIC_API_KEY')
+class ClaudeSnakePlayer(LLMSnakePlayer):
+    def __init__(self, client=None, base_url: Optional[str] = None, **options):
+        super().__init__(**options)
+        self.model = "claude-sonnet-4-20250514"  # Claude model name
+        if client is not None:
+            # e.g. an offline stub for benchmarks
+            self.client = client
+            return
+        # A base URL (e.g. fake_llm_server.py) can also come from the environment
+        base_url = base_url or os.getenv('ANTHROPIC_BASE_URL')
+        api_key = os.getenv('ANTHROPIC_API_KEY') or ("local" if base_url else None)
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
         
         # Use native Anthropic SDK
         self.client = anthropic.Anthropic(
-            api_key=api_key
+            api_key=api_key,
+            base_url=base_url
         )
-        self.model = "claude-sonnet-4-20250514"  # Claude model name
-        self.moves_queue = []  # Store planned moves
         
-    def get_ai_move(self, game_state: Dict[str, Any]) -> Optional[str]:
-        """Use native Anthropic SDK to get the next move for the snake"""
-        # If we have planned moves, use the next one
-        if self.moves_queue:
-            return self.moves_queue.pop(0)
-            
+    def request_plan(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        """Use native Anthropic SDK to plan the next moves for the snake"""
         try:
             # Create the system prompt and user message
-            system_prompt = "You are an expert Snake game AI player. Analyze the game state carefully and plan a sequence of 10 optimal moves to survive and collect food. Always respond with exactly 10 words separated by spaces: UP, DOWN, LEFT, or RIGHT."
-            user_prompt = self.create_game_prompt(game_state)
+            if self.encoding == "prose":
+                system_prompt = "You are an expert Snake game AI player. Analyze the game state carefully and plan a sequence of 10 optimal moves to survive and collect food. Always respond with exactly 10 words separated by spaces: UP, DOWN, LEFT, or RIGHT."
+                user_prompt = self.create_game_prompt(game_state)
+            else:
+                system_prompt = STATIC_PROMPT
+                user_prompt = encode_state(game_state, self.encoding)
             
+            system = {"type": "text", "text": system_prompt}
+            if is_cacheable(system_prompt):
+                # Only worth marking once the prompt reaches the provider's cache minimum
+                system["cache_control"] = {"type": "ephemeral"}
+
             message = self.client.messages.create(
                 model=self.model,
                 max_tokens=50,  # Increased for 10 moves
                 temperature=0.1,
-                system=system_prompt,
+                system=[system],
                 messages=[
                     {
                         "role": "user", 
@@ -43,19 +58,13 @@ class ClaudeSnakePlayer:
                 ]
             )
             
-            # Parse Claude's response
-            moves = message.content[0].text.strip().upper().split()
-            
-            # Validate the moves
-            valid_moves = ["UP", "DOWN", "LEFT", "RIGHT"]
-            valid_sequence = [move for move in moves if move in valid_moves]
+            # Parse and validate Claude's response
+            valid_sequence = self.parse_moves(message.content[0].text)
             
             if valid_sequence:
-                # Store all moves except the first one
-                self.moves_queue = valid_sequence[1:]
-                return valid_sequence[0]
+                return valid_sequence
             else:
-                print(f"Invalid Claude moves: {moves}")
+                print(f"Invalid Claude moves: {message.content[0].text.upper().split()}")
                 return None
                 
         except Exception as e:
@@ -67,7 +76,7 @@ class ClaudeSnakePlayer:
         snake_head = game_state['snake_head']
         food_pos = game_state['food_position']
         snake_body = game_state['snake_body']
-        current_dir = self.heading_to_direction(game_state['current_direction'])
+        current_dir = heading_to_direction(game_state['current_direction'])
         
         # Calculate distance to food
         dx = food_pos['x'] - snake_head['x']
@@ -136,12 +145,6 @@ Respond with exactly 10 words separated by spaces: UP DOWN LEFT RIGHT (in the or
         
         return "\n".join(dangers) if dangers else "No immediate dangers detected"
 
-    def heading_to_direction(self, heading: float) -> str:
-        """Convert turtle heading degrees to readable direction"""
-        heading = int(heading % 360)
-        directions = {0: "RIGHT", 90: "UP", 180: "LEFT", 270: "DOWN"}
-        return directions.get(heading, f"ANGLE_{heading}")
-    
     def format_snake_body(self, snake_body: list) -> str:
         """Format snake body positions for Claude's analysis"""
         if not snake_body:
@@ -181,4 +184,4 @@ Respond with exactly 10 words separated by spaces: UP DOWN LEFT RIGHT (in the or
             return safe_moves[0]
         else:
             # Emergency: try to continue current direction
-            return self.heading_to_direction(current_direction) 
\ No newline at end of file
+            return heading_to_direction(current_direction) 
\ No newline at end of file
@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List
+from engine import MOVE_DISTANCE, WALL_DISTANCE, DELTAS, centred_cell
+from symmetry import SYMMETRIES, MOVE_VECTORS, VECTOR_MOVES, apply, inverse
+
+# Cells either side of the head included in the cache key (7x7 window)
+WINDOW_RADIUS = 3
+# Food further away than this is clamped, since a plan only covers 10 moves
+FOOD_RADIUS = 10
+MAX_ENTRIES = 20000
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "decision_cache.json")
+
+OFFSETS = [(x, y) for y in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1)
+           for x in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1) if (x, y) != (0, 0)]
+
+
+def clamp(value, limit):
+    return max(-limit, min(limit, value))
+
+
+class DecisionCache:
+    """LRU cache of LLM move plans keyed on the snake's local surroundings.
+
+    States are reduced to the food offset, the heading and a 7x7 window of
+    free/body/wall cells around the head, then canonicalized over the eight
+    rotations and reflections so that mirrored situations share one entry.
+    Plans are stored in the canonical frame and mapped back on lookup.
+    """
+
+    def __init__(self, path: Optional[str] = CACHE_FILE, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            self.load()
+
+    def canonicalize(self, game_state: Dict[str, Any]):
+        """Return (key, symmetry) for the canonical form of game_state"""
+        head = game_state["snake_head"]
+        food = game_state["food_position"]
+        bound = game_state.get("screen_bounds", WALL_DISTANCE) // MOVE_DISTANCE
+        head_x, head_y = centred_cell(head["x"], head["y"])
+        body = {centred_cell(seg["x"], seg["y"]) for seg in game_state["snake_body"]}
+        food_x, food_y = centred_cell(food["x"], food["y"])
+        food_offset = (clamp(food_x - head_x, FOOD_RADIUS), clamp(food_y - head_y, FOOD_RADIUS))
+        heading = DELTAS.get(round(game_state["current_direction"]) % 360, (0, 0))
+
+        def cell(offset):
+            x, y = head_x + offset[0], head_y + offset[1]
+            if abs(x) > bound or abs(y) > bound:
+                return "2"
+            return "1" if (x, y) in body else "0"
+
+        best = None
+        for symmetry in SYMMETRIES:
+            back = inverse(symmetry)
+            key = "{},{},{},{}:{}".format(
+                *apply(symmetry, food_offset), *apply(symmetry, heading),
+                "".join(cell(apply(back, offset)) for offset in OFFSETS))
+            if best is None or key < best[0]:
+                best = (key, symmetry)
+        return best
+
+    def get(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        key, symmetry = self.canonicalize(game_state)
+        with self.lock:
+            plan = self.entries.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        back = inverse(symmetry)
+        return [VECTOR_MOVES[apply(back, MOVE_VECTORS[move])] for move in plan]
+
+    def put(self, game_state: Dict[str, Any], moves: List[str]):
+        key, symmetry = self.canonicalize(game_state)
+        plan = [VECTOR_MOVES[apply(symmetry, MOVE_VECTORS[move])] for move in moves]
+        with self.lock:
+            self.entries[key] = plan
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def load(self):
+        try:
+            with open(self.path) as file:
+                self.entries = OrderedDict(json.load(file))
+        except (OSError, ValueError) as e:
+            print(f"Could not load decision cache: {e}")
+
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            with open(self.path, "w") as file:
+                json.dump(self.entries, file)
+
+    def stats(self) -> str:
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        return f"{self.hits}/{lookups} hits ({rate:.1f}%), {len(self.entries)} entries"
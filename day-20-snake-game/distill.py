@@ -0,0 +1,161 @@
+"""Distill logged snake decisions into a small local NumPy policy.
+
+    python distill.py collect --teacher pathfinding --games 200
+    python runner.py --player claude --log-decisions decisions.npz   # log real LLM games
+    python distill.py train --hidden 64 --epochs 30
+    python distill.py bench --games 4096
+    python runner.py --player distilled
+
+The dataset stores each decision as the 9x9 window around the head (bit
+packed), the clamped food offset and the move relative to the heading,
+all in the snake's own frame: 13 bytes per decision before compression,
+under 2 after.
+"""
+import argparse
+import os
+import time
+import numpy as np
+from typing import Dict, Any
+from engine import SnakeEngine
+from batch_env import BatchSnakeEnv, ACTION_INDEX
+from distilled_player import (Policy, BatchFeatures, DistilledSnakePlayer, state_features,
+                              RELATIVE_TO_ACTION, LOCAL_OFFSETS, FOOD_RADIUS, POLICY_FILE)
+
+DATASET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "decisions.npz")
+
+
+class DecisionLog:
+    """Collects (game_state, move) pairs and appends them to a dataset file"""
+
+    def __init__(self, path=DATASET_FILE):
+        self.path = path
+        self.windows = []
+        self.food = []
+        self.moves = []
+
+    def record(self, game_state: Dict[str, Any], move: str):
+        features, heading = state_features(game_state)
+        relative = np.flatnonzero(RELATIVE_TO_ACTION[heading] == ACTION_INDEX[move])
+        # A reversal is ignored by the engine, so it counts as keeping going
+        self.moves.append(relative[0] if len(relative) else 0)
+        self.windows.append(np.packbits(features[:len(LOCAL_OFFSETS)].astype(bool)))
+        self.food.append(np.rint(features[-2:] * FOOD_RADIUS).astype(np.int8))
+
+    def save(self):
+        if not self.moves:
+            return
+        windows, food, moves = np.array(self.windows), np.array(self.food), np.array(self.moves, dtype=np.uint8)
+        if os.path.exists(self.path):
+            with np.load(self.path) as old:
+                windows = np.concatenate([old["windows"], windows])
+                food = np.concatenate([old["food"], food])
+                moves = np.concatenate([old["moves"], moves])
+        np.savez_compressed(self.path, windows=windows, food=food, moves=moves)
+        print(f"💾 {len(self.moves)} decisions logged to {self.path} ({len(moves)} total)")
+        self.windows, self.food, self.moves = [], [], []
+
+
+def load_dataset(path=DATASET_FILE):
+    """(features, relative moves) arrays ready for Policy.fit()"""
+    with np.load(path) as data:
+        windows = np.unpackbits(data["windows"], axis=1, count=len(LOCAL_OFFSETS))
+        food = data["food"].astype(np.float32) / FOOD_RADIUS
+        moves = data["moves"].astype(np.int64)
+    return np.concatenate([windows.astype(np.float32), food], axis=1), moves
+
+
+def collect(args):
+    from runner import PLAYERS, run_game
+    factory = PLAYERS[args.teacher][0]
+    decide_every = args.decide_every or PLAYERS[args.teacher][5]
+    teacher = factory(decide_every, args.base_url, "prose", None)
+    log = DecisionLog(args.dataset)
+    scores = []
+    for seed in range(args.seed, args.seed + args.games):
+        result = run_game(teacher, SnakeEngine(seed=seed), decide_every=decide_every, verbose=False,
+                          max_steps=args.max_steps, report=False, decision_log=log)
+        scores.append(result["score"])
+    if hasattr(teacher, "close"):
+        teacher.close()
+    print(f"🎓 {args.teacher}: {len(scores)} games, mean score {np.mean(scores):.2f}")
+    log.save()
+
+
+def train(args):
+    features, moves = load_dataset(args.dataset)
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(moves))
+    split = int(len(order) * 0.9)
+    train_rows, test_rows = order[:split], order[split:]
+    print(f"📚 {len(moves)} decisions ({split} train, {len(moves) - split} held out)")
+
+    policy = Policy.create(tuple(args.hidden), seed=args.seed)
+    policy.fit(features[train_rows], moves[train_rows], epochs=args.epochs, lr=args.lr, seed=args.seed)
+    print(f"🎯 accuracy: train {policy.accuracy(features[train_rows], moves[train_rows]):.3f}, "
+          f"held out {policy.accuracy(features[test_rows], moves[test_rows]):.3f}")
+    policy.save(args.policy)
+    print(f"💾 Policy saved to {args.policy}")
+
+
+def bench(args):
+    policy = Policy.load(args.policy)
+    env = BatchSnakeEnv(args.games, seed=args.seed)
+    features = BatchFeatures(env)
+    decisions = 0
+    scores = []
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        live = ~env.done
+        env.step(np.where(live, policy.act(*features()), -1))
+        decisions += int(live.sum())
+        finished = env.done & live
+        scores.extend(env.score[finished].tolist())
+        env.reset(finished)
+    elapsed = time.perf_counter() - start
+    scores.extend(env.score[~env.done].tolist())
+    print(f"⚡ {decisions:,} decisions in {elapsed:.2f}s ({decisions / elapsed:,.0f}/s, "
+          f"features + inference + env step)")
+    print(f"🐍 {len(scores)} games, mean score {np.mean(scores):.2f}, best {max(scores)}")
+
+    single = DistilledSnakePlayer(policy)
+    game_state = SnakeEngine(seed=args.seed).to_game_state()
+    start = time.perf_counter()
+    for _ in range(2000):
+        single.get_ai_move(game_state)
+    print(f"🧍 single-state get_ai_move: {(time.perf_counter() - start) / 2000 * 1e6:.1f}µs")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distill snake decisions into a NumPy policy")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    collect_parser = commands.add_parser("collect", help="log a teacher player's decisions")
+    collect_parser.add_argument("--teacher", default="pathfinding")
+    collect_parser.add_argument("--games", type=int, default=100)
+    collect_parser.add_argument("--max-steps", type=int, default=2000)
+    collect_parser.add_argument("--decide-every", type=int, default=None)
+    collect_parser.add_argument("--base-url", default=None)
+    collect_parser.add_argument("--seed", type=int, default=0)
+    collect_parser.add_argument("--dataset", default=DATASET_FILE)
+
+    train_parser = commands.add_parser("train", help="fit a policy to the logged decisions")
+    train_parser.add_argument("--hidden", type=int, nargs="*", default=[32],
+                              help="hidden layer sizes (none for a linear model)")
+    train_parser.add_argument("--epochs", type=int, default=20)
+    train_parser.add_argument("--lr", type=float, default=0.003)
+    train_parser.add_argument("--seed", type=int, default=0)
+    train_parser.add_argument("--dataset", default=DATASET_FILE)
+    train_parser.add_argument("--policy", default=POLICY_FILE)
+
+    bench_parser = commands.add_parser("bench", help="measure batched inference on BatchSnakeEnv")
+    bench_parser.add_argument("--games", type=int, default=4096)
+    bench_parser.add_argument("--steps", type=int, default=200)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--policy", default=POLICY_FILE)
+
+    args = parser.parse_args(argv)
+    {"collect": collect, "train": train, "bench": bench}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
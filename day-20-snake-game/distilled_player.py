@@ -0,0 +1,246 @@
+import os
+from functools import lru_cache
+import numpy as np
+from typing import Optional, Dict, Any
+from engine import MOVE_DISTANCE, WALL_DISTANCE, DIRECTIONS, centred_cell
+from batch_env import ACTIONS
+from symmetry import HEADING_FRAMES, MOVE_VECTORS, apply, inverse
+
+# Cells either side of the head seen by the policy (9x9 window)
+WINDOW_RADIUS = 4
+# Food offsets are clamped to this many cells and scaled to [-1, 1]
+FOOD_RADIUS = 10
+POLICY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "distilled_policy.npz")
+
+# Features are taken in the snake's own frame, with its heading pointing up.
+# FRAMES maps world vectors into that frame, indexed like batch_env.ACTIONS.
+FRAMES = [HEADING_FRAMES[DIRECTIONS[action]] for action in ACTIONS]
+HEADING_ACTIONS = {DIRECTIONS[action]: index for index, action in enumerate(ACTIONS)}
+# Relative moves: keep going, turn left, turn right
+RELATIVE_MOVES = [(0, 1), (-1, 0), (1, 0)]
+LOCAL_OFFSETS = [(x, y) for y in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1)
+                 for x in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1) if (x, y) != (0, 0)]
+# Window positions of the three cells the head can move into
+NEXT_CELLS = [LOCAL_OFFSETS.index(move) for move in RELATIVE_MOVES]
+FEATURES = len(LOCAL_OFFSETS) + 2
+
+
+def to_world(frame, vector):
+    return apply(inverse(frame), vector)
+
+
+WORLD_VECTORS = [MOVE_VECTORS[action] for action in ACTIONS]
+# RELATIVE_TO_ACTION[heading][relative move] -> index into ACTIONS
+RELATIVE_TO_ACTION = np.array([[WORLD_VECTORS.index(to_world(frame, move)) for move in RELATIVE_MOVES]
+                               for frame in FRAMES], dtype=np.int64)
+
+
+def state_features(game_state: Dict[str, Any]):
+    """(features, heading action index) for one game_state dict"""
+    head = game_state["snake_head"]
+    food = game_state["food_position"]
+    bound = game_state.get("screen_bounds", WALL_DISTANCE) // MOVE_DISTANCE
+    col, row = centred_cell(head["x"], head["y"])
+    body = {centred_cell(seg["x"], seg["y"]) for seg in game_state["snake_body"]}
+    heading = HEADING_ACTIONS.get(round(game_state["current_direction"]) % 360, 3)
+    frame = FRAMES[heading]
+
+    features = np.empty(FEATURES, dtype=np.float32)
+    for i, offset in enumerate(LOCAL_OFFSETS):
+        dx, dy = to_world(frame, offset)
+        x, y = col + dx, row + dy
+        features[i] = abs(x) > bound or abs(y) > bound or (x, y) in body
+    food_col, food_row = centred_cell(food["x"], food["y"])
+    food_x, food_y = apply(frame, (food_col - col, food_row - row))
+    features[-2] = max(-FOOD_RADIUS, min(FOOD_RADIUS, food_x)) / FOOD_RADIUS
+    features[-1] = max(-FOOD_RADIUS, min(FOOD_RADIUS, food_y)) / FOOD_RADIUS
+    return features, heading
+
+
+@lru_cache(maxsize=None)
+def window_tables(stride):
+    """Flat offsets of the window cells, rotated into each heading's frame"""
+    return np.array([[dy * stride + dx for dx, dy in (to_world(frame, offset) for offset in LOCAL_OFFSETS)]
+                     for frame in FRAMES], dtype=np.int64)
+
+
+def observation_features(observation):
+    """state_features() read straight off an Observation's occupancy plane"""
+    pad = WINDOW_RADIUS
+    height, width = observation.occupancy.shape
+    padded = np.ones((height + 2 * pad, width + 2 * pad), dtype=np.float32)
+    padded[pad:-pad, pad:-pad] = observation.occupancy
+    col, row = observation.head
+    heading = HEADING_ACTIONS.get(round(observation.heading) % 360, 3)
+    frame = FRAMES[heading]
+
+    stride = width + 2 * pad
+    features = np.empty(FEATURES, dtype=np.float32)
+    features[:-2] = padded.ravel()[(row + pad) * stride + col + pad + window_tables(stride)[heading]]
+    food_x, food_y = apply(frame, (observation.food[0] - col, observation.food[1] - row))
+    features[-2] = max(-FOOD_RADIUS, min(FOOD_RADIUS, food_x)) / FOOD_RADIUS
+    features[-1] = max(-FOOD_RADIUS, min(FOOD_RADIUS, food_y)) / FOOD_RADIUS
+    return features, heading
+
+
+class BatchFeatures:
+    """Vectorized state_features() for every game of a BatchSnakeEnv.
+
+    The board is padded with blocked cells so every window can be gathered
+    with one fancy-indexing call; each heading has its own table of flat
+    offsets that rotates the window into the snake's frame.
+    """
+
+    def __init__(self, env):
+        self.env = env
+        pad = WINDOW_RADIUS
+        self.stride = env.width + 2 * pad
+        self.padded = np.ones((env.n, env.height + 2 * pad, self.stride), dtype=np.float32)
+        self.tables = window_tables(self.stride)
+        self.frames = np.array(FRAMES, dtype=np.int64)
+
+    def __call__(self):
+        """(features (N, FEATURES), heading action indices (N,))"""
+        env, pad = self.env, WINDOW_RADIUS
+        self.padded[:, pad:-pad, pad:-pad] = env.occupied.reshape(env.n, env.height, env.width)
+        head = env.body[env.rows, env.head_ptr]
+        col, row = head % env.width, head // env.width
+        centre = (row + pad) * self.stride + col + pad
+        windows = self.padded.reshape(env.n, -1)[env.rows[:, None], centre[:, None] + self.tables[env.heading]]
+
+        a, b, c, d = self.frames[env.heading].T
+        # A full board has no food (-1); use the head like SnakeEngine.to_game_state()
+        food_cell = np.where(env.food >= 0, env.food, head)
+        dx = food_cell % env.width - col
+        dy = food_cell // env.width - row
+        food = np.stack([a * dx + b * dy, c * dx + d * dy], axis=1)
+        food = np.clip(food, -FOOD_RADIUS, FOOD_RADIUS).astype(np.float32) / FOOD_RADIUS
+        return np.concatenate([windows, food], axis=1), env.heading
+
+
+class Policy:
+    """Tiny MLP (or linear model with no hidden layers) over state features.
+
+    Outputs logits for the three relative moves. layers is a list of
+    (weights, bias) pairs; hidden layers use ReLU.
+    """
+
+    def __init__(self, layers):
+        self.layers = [(np.asarray(w, dtype=np.float32), np.asarray(b, dtype=np.float32))
+                       for w, b in layers]
+
+    @classmethod
+    def create(cls, hidden=(32,), seed=None):
+        rng = np.random.default_rng(seed)
+        sizes = [FEATURES, *hidden, len(RELATIVE_MOVES)]
+        return cls([(rng.normal(0, np.sqrt(2 / fan_in), (fan_in, fan_out)), np.zeros(fan_out))
+                    for fan_in, fan_out in zip(sizes, sizes[1:])])
+
+    @classmethod
+    def load(cls, path=POLICY_FILE):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No trained policy at {path}; run `python distill.py collect` "
+                                    f"and `python distill.py train` first")
+        with np.load(path) as data:
+            return cls([(data[f"w{i}"], data[f"b{i}"]) for i in range(len(data.files) // 2)])
+
+    def save(self, path=POLICY_FILE):
+        arrays = {}
+        for i, (w, b) in enumerate(self.layers):
+            arrays[f"w{i}"], arrays[f"b{i}"] = w, b
+        np.savez(path, **arrays)
+
+    def forward(self, x):
+        """Logits, plus every layer's input for backprop"""
+        inputs = []
+        for i, (w, b) in enumerate(self.layers):
+            inputs.append(x)
+            x = x @ w + b
+            if i < len(self.layers) - 1:
+                x = np.maximum(x, 0)
+        return x, inputs
+
+    def act(self, features, headings):
+        """Batched ACTIONS indices, never turning into a blocked cell if avoidable"""
+        logits, _ = self.forward(features)
+        blocked = features[:, NEXT_CELLS] > 0
+        logits = np.where(blocked & ~blocked.all(axis=1, keepdims=True), -np.inf, logits)
+        return RELATIVE_TO_ACTION[headings, logits.argmax(axis=1)]
+
+    def fit(self, features, moves, epochs=20, batch_size=256, lr=0.003, seed=None, log=print):
+        """Train with softmax cross-entropy and Adam; moves are relative move indices"""
+        rng = np.random.default_rng(seed)
+        params = [p for layer in self.layers for p in layer]
+        first = [np.zeros_like(p) for p in params]
+        second = [np.zeros_like(p) for p in params]
+        step = 0
+        for epoch in range(epochs):
+            order = rng.permutation(len(features))
+            total = 0.0
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                logits, inputs = self.forward(features[batch])
+                logits -= logits.max(axis=1, keepdims=True)
+                probs = np.exp(logits)
+                probs /= probs.sum(axis=1, keepdims=True)
+                total += -np.log(probs[np.arange(len(batch)), moves[batch]] + 1e-9).sum()
+
+                grad = probs
+                grad[np.arange(len(batch)), moves[batch]] -= 1
+                grad /= len(batch)
+                grads = []
+                for i in reversed(range(len(self.layers))):
+                    w, _ = self.layers[i]
+                    grads[:0] = [inputs[i].T @ grad, grad.sum(axis=0)]
+                    if i:
+                        grad = (grad @ w.T) * (inputs[i] > 0)
+
+                step += 1
+                for p, g, m, v in zip(params, grads, first, second):
+                    m += 0.1 * (g - m)
+                    v += 0.001 * (g * g - v)
+                    p -= lr * (m / (1 - 0.9 ** step)) / (np.sqrt(v / (1 - 0.999 ** step)) + 1e-8)
+            log(f"  epoch {epoch + 1:3d}  loss {total / len(features):.4f}")
+
+    def accuracy(self, features, moves):
+        logits, _ = self.forward(features)
+        return float((logits.argmax(axis=1) == moves).mean())
+
+
+class DistilledSnakePlayer:
+    """Local player that imitates logged LLM decisions (see distill.py).
+
+    A trained Policy picks one of three relative moves from a 9x9 window
+    around the head and the food offset, in microseconds. With a teacher
+    set, states where the policy's top move has less than min_confidence
+    probability are handed to the teacher instead, so the expensive model
+    only sees the hard cases.
+    """
+
+    def __init__(self, policy: Optional[Policy] = None, teacher=None, min_confidence: float = 0.0):
+        self.policy = policy or Policy.load()
+        self.teacher = teacher
+        self.min_confidence = min_confidence
+        self.deferred = 0
+
+    def get_ai_move(self, game_state: Dict[str, Any]) -> Optional[str]:
+        if hasattr(game_state, "occupancy"):
+            features, heading = observation_features(game_state)
+        else:
+            features, heading = state_features(game_state)
+        features, headings = features[None, :], np.array([heading])
+        if self.teacher and self.min_confidence:
+            logits, _ = self.policy.forward(features)
+            probs = np.exp(logits - logits.max())
+            if probs.max() / probs.sum() < self.min_confidence:
+                self.deferred += 1
+                return self.teacher.get_ai_move(game_state)
+        return ACTIONS[self.policy.act(features, headings)[0]]
+
+    def get_safe_fallback_move(self, snake_head, current_direction, wall_distance=295) -> str:
+        """get_ai_move() always answers, so just keep going"""
+        return ACTIONS[HEADING_ACTIONS.get(round(current_direction) % 360, 3)]
+
+    def close(self):
+        if self.teacher and hasattr(self.teacher, "close"):
+            self.teacher.close()
@@ -0,0 +1,234 @@
+import random
+from collections import deque
+
+START_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
+MOVE_DISTANCE = 20
+WALL_DISTANCE = 295
+UP = 90
+DOWN = 270
+LEFT = 180
+RIGHT = 0
+
+# Board size in cells; 29x29 matches the 600x600 window with walls at ±295
+GRID_SIZE = 2 * (WALL_DISTANCE // MOVE_DISTANCE) + 1
+
+DIRECTIONS = {"UP": UP, "DOWN": DOWN, "LEFT": LEFT, "RIGHT": RIGHT}
+# One byte per heading in replay logs
+HEADING_CODES = {UP: 0, DOWN: 1, LEFT: 2, RIGHT: 3}
+CODE_HEADINGS = {code: heading for heading, code in HEADING_CODES.items()}
+DELTAS = {UP: (0, 1), DOWN: (0, -1), LEFT: (-1, 0), RIGHT: (1, 0)}
+OPPOSITES = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+# Events returned by SnakeEngine.step()
+ATE_FOOD = "ate_food"
+HIT_WALL = "hit_wall"
+HIT_BODY = "hit_body"
+
+# Values stored in the occupancy grid
+EMPTY = 0
+BODY_CELL = 1
+WALL_CELL = 2
+
+
+def centred_cell(x, y):
+    """(col, row) of a pixel position, counted from the centre cell"""
+    return round(x / MOVE_DISTANCE), round(y / MOVE_DISTANCE)
+
+
+def heading_to_direction(heading: float) -> str:
+    """Convert turtle heading degrees to readable direction"""
+    heading = int(heading % 360)
+    directions = {RIGHT: "RIGHT", UP: "UP", LEFT: "LEFT", DOWN: "DOWN"}
+    return directions.get(heading, f"ANGLE_{heading}")
+
+
+class FreeCells:
+    """Set of cells with O(1) add, remove and uniform random choice.
+
+    Cells live in a flat list; removing one swaps the last cell into its
+    slot, so sampling never has to retry however full the board gets.
+    """
+
+    def __init__(self, cells=(), rng=random):
+        self.rng = rng
+        self.cells = list(cells)
+        self.slots = {cell: slot for slot, cell in enumerate(self.cells)}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.slots
+
+    def add(self, cell):
+        if cell not in self.slots:
+            self.slots[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell):
+        slot = self.slots.pop(cell)
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.slots[last] = slot
+
+    def choice(self):
+        return self.rng.choice(self.cells) if self.cells else None
+
+
+class SnakeEngine:
+    """Turtle-free snake simulation on a grid of cells.
+
+    The body is a deque of (col, row) cells with the head on the left, so a
+    step is one appendleft plus one pop no matter how long the snake is.
+    Occupancy lives in a bytearray with a one-cell wall border, which turns
+    both the wall and the self-collision test into a single index lookup.
+    All randomness comes from a seeded RNG, and an optional recorder gets
+    one heading code per step, so a seed plus those bytes replays a game.
+    The first observe() call adds a NumPy ObservationBuffer that is then
+    kept up to date step by step.
+    """
+
+    def __init__(self, width=GRID_SIZE, height=GRID_SIZE, seed=None, recorder=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.recorder = recorder
+        self.observation = None
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.grid = bytearray([WALL_CELL]) * (self.stride * (height + 2))
+        for row in range(height):
+            start = self.index((0, row))
+            self.grid[start:start + width] = bytes(width)
+        self.body = deque(self.to_cell(position) for position in START_POSITIONS)
+        for cell in self.body:
+            self.grid[self.index(cell)] = BODY_CELL
+        self.free = FreeCells(((col, row) for row in range(height) for col in range(width)
+                               if self.is_free((col, row))), self.rng)
+        self.heading = RIGHT
+        self.food = None
+        self.score = 0
+        self.steps = 0
+        self.game_over = False
+        self.place_food()
+
+    @classmethod
+    def from_game_state(cls, game_state):
+        """Rebuild an engine from the dict the AI players receive"""
+        bounds = game_state.get("screen_bounds", WALL_DISTANCE)
+        size = 2 * (bounds // MOVE_DISTANCE) + 1
+        engine = cls(size, size)
+        positions = [game_state["snake_head"]] + list(game_state["snake_body"])
+        engine.set_state([engine.to_cell((p["x"], p["y"])) for p in positions],
+                         round(game_state["current_direction"]) % 360,
+                         engine.to_cell((game_state["food_position"]["x"],
+                                         game_state["food_position"]["y"])))
+        return engine
+
+    def set_state(self, body, heading, food):
+        """Replace the snake and food, keeping the grid and free cells in sync"""
+        for cell in self.body:
+            self.grid[self.index(cell)] = EMPTY
+            self.free.add(cell)
+        self.body = deque()
+        for cell in body:
+            if self.is_free(cell):
+                self.grid[self.index(cell)] = BODY_CELL
+                self.free.remove(cell)
+                self.body.append(cell)
+        self.heading = heading
+        self.food = food
+        if self.observation:
+            self.observation.reset(self.body)
+
+    def to_game_state(self):
+        """Describe the game in the dict format the AI players expect"""
+        head, *body = [self.to_position(cell) for cell in self.body]
+        food = self.to_position(self.food) if self.food is not None else head
+        return {
+            "snake_head": {"x": head[0], "y": head[1]},
+            "snake_body": [{"x": x, "y": y} for x, y in body],
+            "food_position": {"x": food[0], "y": food[1]},
+            "current_direction": self.heading,
+            "screen_bounds": (self.width // 2) * MOVE_DISTANCE + WALL_DISTANCE % MOVE_DISTANCE,
+        }
+
+    def observe(self):
+        """Read-only Observation of the current state; see observation.py"""
+        from observation import Observation, ObservationBuffer
+        if self.observation is None:
+            self.observation = ObservationBuffer(self.width, self.height, self.body)
+        return Observation(self)
+
+    def to_cell(self, position):
+        """Convert a pixel position (centre origin) to a (col, row) cell"""
+        col, row = centred_cell(*position)
+        return col + self.width // 2, row + self.height // 2
+
+    def to_position(self, cell):
+        """Convert a (col, row) cell to a pixel position (centre origin)"""
+        col, row = cell
+        return ((col - self.width // 2) * MOVE_DISTANCE,
+                (row - self.height // 2) * MOVE_DISTANCE)
+
+    def index(self, cell):
+        """Position of a cell in the padded occupancy grid"""
+        return (cell[1] + 1) * self.stride + cell[0] + 1
+
+    def is_free(self, cell):
+        return self.grid[self.index(cell)] == EMPTY
+
+    @property
+    def head(self):
+        return self.body[0]
+
+    def turn(self, direction):
+        """Change heading, ignoring reversals; accepts degrees or 'UP' etc."""
+        heading = DIRECTIONS.get(direction, direction)
+        if heading in DELTAS and heading != OPPOSITES[self.heading]:
+            self.heading = heading
+
+    def place_food(self):
+        self.food = self.free.choice()
+
+    def step(self, direction=None):
+        """Advance one tick and return ATE_FOOD, HIT_WALL, HIT_BODY or None"""
+        if self.game_over:
+            return None
+        if direction is not None:
+            self.turn(direction)
+        if self.recorder:
+            self.recorder.record(HEADING_CODES[self.heading])
+
+        dx, dy = DELTAS[self.heading]
+        col, row = self.body[0]
+        new_head = (col + dx, row + dy)
+        self.steps += 1
+
+        target = self.index(new_head)
+        if self.grid[target] == WALL_CELL:
+            self.game_over = True
+            return HIT_WALL
+
+        ate = new_head == self.food
+        if not ate:
+            tail = self.body.pop()
+            self.grid[self.index(tail)] = EMPTY
+            self.free.add(tail)
+            if self.observation:
+                self.observation.pop_tail(tail)
+        if self.grid[target] == BODY_CELL:
+            self.game_over = True
+            return HIT_BODY
+        self.grid[target] = BODY_CELL
+        self.free.remove(new_head)
+        self.body.appendleft(new_head)
+        if self.observation:
+            self.observation.push_head(new_head)
+
+        if ate:
+            self.score += 1
+            self.place_food()
+            return ATE_FOOD
+        return None
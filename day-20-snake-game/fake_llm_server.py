@@ -0,0 +1,234 @@
+"""Local stand-in for the OpenAI Responses and Anthropic Messages endpoints.
+
+    python fake_llm_server.py --port 8765 --latency 0.3 --error-rate 0.05 --malformed-rate 0.1
+
+Then point the players at it:
+    OpenAI:    base_url http://127.0.0.1:8765/v1 (runner.py and tournament.py add the /v1)
+    Anthropic: base_url http://127.0.0.1:8765
+
+Answers are greedy plans toward the food (see stub_clients.greedy_plan),
+delayed by a configurable latency distribution, with injectable HTTP
+errors and malformed outputs. GET /stats returns request counters.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from stub_clients import greedy_plan
+from prompt_encoding import count_tokens, MIN_CACHEABLE_TOKENS
+
+MALFORMED_ANSWERS = [
+    "I think the snake should probably head towards the food.",
+    "UPP DWN LFT RIGTH",
+    "",
+    "{\"moves\": [1, 2, 3]}",
+]
+
+
+class LatencyModel:
+    """Response delay in seconds: fixed, uniform(0, 2*median) or log-normal"""
+
+    def __init__(self, kind="lognormal", median=0.0, sigma=0.5, seed=None):
+        self.kind = kind
+        self.median = median
+        self.sigma = sigma
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def sample(self):
+        if not self.median:
+            return 0.0
+        with self.lock:
+            if self.kind == "fixed":
+                return self.median
+            if self.kind == "uniform":
+                return self.rng.uniform(0, 2 * self.median)
+            return self.median * self.rng.lognormvariate(0, self.sigma)
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency, error_rate=0.0, malformed_rate=0.0, seed=None):
+        super().__init__(address, FakeLLMHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "errors": 0, "malformed": 0, "ok": 0}
+        self.cached_prefixes = set()
+
+    def cache_usage(self, system):
+        """Anthropic-style (creation, read) token counts for cache_control blocks.
+
+        Like the real APIs, blocks shorter than MIN_CACHEABLE_TOKENS are
+        never cached.
+        """
+        created = read = 0
+        for block in system if isinstance(system, list) else []:
+            if not block.get("cache_control"):
+                continue
+            tokens = count_tokens(block.get("text", ""))
+            if tokens < MIN_CACHEABLE_TOKENS:
+                continue
+            with self.lock:
+                if block.get("text") in self.cached_prefixes:
+                    read += tokens
+                else:
+                    self.cached_prefixes.add(block.get("text"))
+                    created += tokens
+        return created, read
+
+    def roll(self):
+        """Decide this request's fate: 'error', 'malformed' or 'ok'"""
+        with self.lock:
+            self.counters["requests"] += 1
+            draw = self.rng.random()
+            if draw < self.error_rate:
+                outcome = "errors"
+            elif draw < self.error_rate + self.malformed_rate:
+                outcome = "malformed"
+            else:
+                outcome = "ok"
+            self.counters[outcome] += 1
+            malformed = self.rng.choice(MALFORMED_ANSWERS)
+        return outcome, malformed
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            with self.server.lock:
+                self.send_json(200, dict(self.server.counters))
+        else:
+            self.send_json(404, {"error": {"type": "not_found", "message": self.path}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        path = self.path.split("?")[0].rstrip("/")
+        if path not in ("/v1/responses", "/v1/messages"):
+            self.send_json(404, {"error": {"type": "not_found", "message": self.path}})
+            return
+
+        time.sleep(self.server.latency.sample())
+        outcome, malformed = self.server.roll()
+        if outcome == "errors":
+            self.send_json(500, {"error": {"type": "api_error", "message": "Injected failure"}})
+            return
+
+        if path == "/v1/responses":
+            prompt = prompt_text(request.get("input", ""))
+        else:
+            prompt = prompt_text(request.get("messages", [{}])[-1].get("content", ""))
+        text = malformed if outcome == "malformed" else " ".join(greedy_plan(prompt))
+
+        if path == "/v1/responses":
+            self.send_json(200, openai_response(request, text))
+        else:
+            self.send_json(200, anthropic_message(request, prompt, text, self.server.cache_usage(request.get("system"))))
+
+
+def prompt_text(content):
+    """Flatten a string, or a list of content blocks/messages, into plain text"""
+    if isinstance(content, str):
+        return content
+    parts = []
+    for item in content:
+        if isinstance(item, str):
+            parts.append(item)
+        elif isinstance(item.get("content"), (str, list)):
+            parts.append(prompt_text(item["content"]))
+        else:
+            parts.append(item.get("text", ""))
+    return "\n".join(parts)
+
+
+def openai_response(request, text):
+    input_tokens = count_tokens(prompt_text(request.get("input", "")))
+    output_tokens = len(text.split())
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": request.get("model", "stand-in"),
+        "output": [{
+            "type": "message",
+            "id": f"msg_{uuid.uuid4().hex}",
+            "status": "completed",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens,
+                  "total_tokens": input_tokens + output_tokens},
+    }
+
+
+def anthropic_message(request, prompt, text, cache_usage=(0, 0)):
+    return {
+        "id": f"msg_{uuid.uuid4().hex}",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model", "stand-in"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": count_tokens(prompt), "output_tokens": len(text.split()),
+                  "cache_creation_input_tokens": cache_usage[0], "cache_read_input_tokens": cache_usage[1]},
+    }
+
+
+def start_server(port=0, latency=None, error_rate=0.0, malformed_rate=0.0, seed=None):
+    """Serve on a background thread; returns the server (see server.server_port)"""
+    server = FakeLLMServer(("127.0.0.1", port), latency or LatencyModel(), error_rate, malformed_rate, seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve fake OpenAI/Anthropic snake answers locally")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="median response delay in seconds")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="log-normal shape (tail weight)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that get HTTP 500")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="fraction of answers that are junk")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    latency = LatencyModel(args.latency_dist, args.latency, args.latency_sigma, args.seed)
+    server = FakeLLMServer(("127.0.0.1", args.port), latency, args.error_rate, args.malformed_rate, args.seed)
+    print(f"🧪 Fake LLM server on http://127.0.0.1:{server.server_port}")
+    print(f"   OpenAI base_url:    http://127.0.0.1:{server.server_port}/v1")
+    print(f"   Anthropic base_url: http://127.0.0.1:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    with server.lock:
+        print(f"\n📊 {server.counters}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,10 @@
-from turtle import Turtle
-import random
+from gamekit.render import Actor
 
 
-class Food(Turtle):
-    def __init__(self):
-        super().__init__()
-        self.shape("circle")
+class Food(Actor):
+    def __init__(self, engine):
+        super().__init__("circle")
+        self.engine = engine
         self.penup()
         self.shapesize(stretch_len=0.5, stretch_wid=0.5)
         self.color("red")
@@ -13,6 +12,6 @@ class Food(Turtle):
         self.refresh()
 
     def refresh(self):
-        random_x = random.randint(-280, 280)
-        random_y = random.randint(-280, 280)
-        self.goto(random_x, random_y)
+        """Move to wherever the engine last placed the food"""
+        if self.engine.food is not None:
+            self.goto(self.engine.to_position(self.engine.food))
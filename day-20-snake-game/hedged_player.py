@@ -0,0 +1,122 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, Dict, Any, List
+from gamekit.loop import percentile
+from llm_player import LLMSnakePlayer
+from observation import as_game_state
+
+
+class HedgedSnakePlayer(LLMSnakePlayer):
+    """Races the same game state across several LLM players.
+
+    providers maps a name to a player whose request_plan() does the actual
+    call (build them with prefetch=False). Without a hedge_delay every
+    provider is asked at once; with one, the next provider is only asked
+    if nothing valid has come back after that many seconds. The first plan
+    that is still non-empty after validate() wins and the rest are
+    cancelled; calls already on the wire can't be aborted, so they finish
+    in the background and are ignored. Those stale calls are tracked, and
+    once they fill the thread pool new calls get a fresh pool instead of
+    queueing behind them.
+    """
+
+    def __init__(self, providers: Dict[str, LLMSnakePlayer], hedge_delay: Optional[float] = None,
+                 **options):
+        super().__init__(**options)
+        self.providers = providers
+        self.hedge_delay = hedge_delay
+        self.pool_size = 2 * len(providers)
+        self.pool = ThreadPoolExecutor(max_workers=self.pool_size)
+        self.in_flight = set()  # Futures of calls still running on the current pool
+        self.in_flight_lock = threading.Lock()
+        self.pools_replaced = 0
+        self.rejected = 0  # Plans that parsed but had nothing safe to play
+        self.wins = {name: 0 for name in providers}
+        self.requests = {name: 0 for name in providers}
+        self.latencies = {name: [] for name in providers}
+
+    def timed_request(self, name: str, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        start = time.perf_counter()
+        moves = self.providers[name].request_plan(game_state)
+        self.latencies[name].append((time.perf_counter() - start) * 1000)
+        return moves
+
+    def submit(self, name: str, game_state: Dict[str, Any]):
+        with self.in_flight_lock:
+            if len(self.in_flight) >= self.pool_size:
+                # Every worker is stuck on a stale call; leave them to finish on the old pool
+                self.pool.shutdown(wait=False)
+                self.pool = ThreadPoolExecutor(max_workers=self.pool_size)
+                self.in_flight = set()
+                self.pools_replaced += 1
+            future = self.pool.submit(self.timed_request, name, game_state)
+            self.in_flight.add(future)
+            in_flight = self.in_flight
+        future.add_done_callback(lambda future: self.finished(in_flight, future))
+        return future
+
+    def finished(self, in_flight, future):
+        with self.in_flight_lock:
+            in_flight.discard(future)
+
+    def request_plan(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        """Return the first plan any provider comes up with that is safe to play"""
+        # Losing requests keep running after we return, so they need a detached state
+        game_state = as_game_state(game_state)
+        waiting = list(self.providers)
+        running = {}
+        winner = None
+        while (waiting or running) and not winner:
+            if waiting:
+                name = waiting.pop(0)
+                self.requests[name] += 1
+                running[self.submit(name, game_state)] = name
+            # Hold off on the next provider for hedge_delay (all at once without one)
+            timeout = self.hedge_delay if waiting else None
+            if waiting and timeout is None:
+                continue
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                moves = future.exception() is None and future.result()
+                if not moves or winner:
+                    continue
+                # A plan validate() cuts to nothing loses; a slower provider may still be safe
+                moves = self.validate(moves, game_state)
+                if moves:
+                    winner = (name, moves)
+                else:
+                    self.rejected += 1
+
+        for future in running:
+            future.cancel()
+        if not winner:
+            return None
+        self.wins[winner[0]] += 1
+        return winner[1]
+
+    def get_safe_fallback_move(self, snake_head, current_direction, wall_distance=295) -> str:
+        first = next(iter(self.providers.values()))
+        return first.get_safe_fallback_move(snake_head, current_direction, wall_distance)
+
+    def provider_summary(self) -> Dict[str, Dict[str, Any]]:
+        return {name: {"requests": self.requests[name], "wins": self.wins[name],
+                       "latencies": list(self.latencies[name])}
+                for name in self.providers}
+
+    def provider_stats(self) -> str:
+        parts = []
+        for name, summary in self.provider_summary().items():
+            p50 = percentile(summary["latencies"], 50)
+            p99 = percentile(summary["latencies"], 99)
+            win_rate = summary["wins"] / summary["requests"] * 100 if summary["requests"] else 0.0
+            parts.append(f"{name} won {summary['wins']}/{summary['requests']} ({win_rate:.0f}%), "
+                         f"p50 {p50:.0f}ms p99 {p99:.0f}ms")
+        parts.append(f"{self.rejected} unsafe plans rejected, "
+                     f"{self.pools_replaced} pools replaced behind stale calls")
+        return "; ".join(parts)
+
+    def close(self):
+        super().close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,230 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+from engine import SnakeEngine, ATE_FOOD, HIT_WALL, HIT_BODY
+from decision_cache import DecisionCache
+from cadence import AdaptiveCadence
+from prompt_encoding import ENCODINGS
+from observation import as_game_state
+
+VALID_MOVES = ["UP", "DOWN", "LEFT", "RIGHT"]
+# Without a cadence, ask for the next plan once this many moves (or fewer) are left
+PREFETCH_THRESHOLD = 4
+
+
+class LLMSnakePlayer:
+    """Plan pipeline shared by the LLM-backed snake players.
+
+    Subclasses implement request_plan(), which calls their provider and
+    returns a list of moves (or None). With prefetch on, that call runs on a
+    background thread: the next plan is requested while the current queue
+    still has moves left, and get_ai_move() never waits for the network.
+    An optional DecisionCache answers repeated situations without a request.
+    Every plan is dry-run on a SnakeEngine before use (see validate()), and
+    the queue is dropped when the food it was heading for is gone.
+    encoding picks the prompt format: "prose" (create_game_prompt) or one of
+    the compact prompt_encoding formats, "grid" or "rle". An AdaptiveCadence
+    replaces the fixed PREFETCH_THRESHOLD and limits how much of each plan
+    is used near walls and the body.
+    """
+
+    def __init__(self, prefetch: bool = True, ticks_per_move: int = 1,
+                 cache: Optional[DecisionCache] = None, encoding: str = "prose",
+                 cadence: Optional[AdaptiveCadence] = None):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown prompt encoding {encoding!r}")
+        self.moves_queue = deque()  # Store planned moves
+        self.queue_food = None  # Food position the queued moves were planned for
+        self.spare_moves = deque()  # Plan moves past the cadence horizon, for when the next plan is late
+        self.encoding = encoding
+        self.prefetch = prefetch
+        self.ticks_per_move = ticks_per_move
+        self.cache = cache
+        self.cadence = cadence
+        self.executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self.pending = None  # (future, projected origin) of the in-flight request
+        self.ready_plan = None  # (origin, moves) waiting for the queue to drain
+        self.plans_received = 0
+        self.plans_reconciled = 0
+        self.plans_discarded = 0
+        self.plans_truncated = 0
+        self.queues_invalidated = 0
+        self.spare_moves_used = 0
+        self.requests_held = 0
+
+    def request_plan(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        raise NotImplementedError
+
+    def parse_moves(self, text: str) -> List[str]:
+        return [move for move in text.strip().upper().split() if move in VALID_MOVES]
+
+    def get_ai_move(self, game_state: Dict[str, Any]) -> Optional[str]:
+        """Return the next planned move, or None while no plan is available"""
+        if self.cadence:
+            self.cadence.observe_decision(time.perf_counter())
+        self.check_food(game_state)
+        if not self.prefetch:
+            if not self.moves_queue:
+                moves = self.cached_plan(game_state) or self.fetch_plan(game_state) or []
+                self.set_queue(self.validate(moves, game_state), game_state)
+            return self.moves_queue.popleft() if self.moves_queue else None
+
+        self.collect_plan()
+        if not self.moves_queue and self.ready_plan:
+            origin, moves = self.ready_plan
+            self.ready_plan = None
+            self.set_queue(self.reconcile(origin, moves, game_state), game_state)
+        if not self.moves_queue and self.spare_moves:
+            self.spare_moves_used += 1
+            self.moves_queue.append(self.spare_moves.popleft())
+
+        move = self.moves_queue.popleft() if self.moves_queue else None
+        lead = self.prefetch_threshold()
+        if not self.pending and not self.ready_plan and len(self.moves_queue) <= lead:
+            upcoming = ([move] if move else []) + list(self.moves_queue)
+            projected = self.project(game_state, upcoming)
+            if projected:
+                self.start_request(projected, lead)
+            else:
+                self.requests_held += 1
+        return move
+
+    def prefetch_threshold(self) -> int:
+        return self.cadence.lead_moves() if self.cadence else PREFETCH_THRESHOLD
+
+    def set_queue(self, moves: List[str], game_state: Dict[str, Any]):
+        self.spare_moves = deque()
+        if self.cadence and moves:
+            horizon = self.cadence.horizon(game_state)
+            if self.prefetch:
+                self.spare_moves = deque(moves[horizon:])
+            moves = moves[:horizon]
+            self.cadence.observe_plan(len(moves))
+        self.moves_queue = deque(moves)
+        food = game_state["food_position"]
+        self.queue_food = (food["x"], food["y"])
+
+    def check_food(self, game_state: Dict[str, Any]):
+        """Drop the queued moves once the food they were heading for has respawned"""
+        food = game_state["food_position"]
+        if self.moves_queue and self.queue_food != (food["x"], food["y"]):
+            self.moves_queue.clear()
+            self.spare_moves.clear()
+            self.queues_invalidated += 1
+
+    def validate(self, moves: List[str], game_state: Dict[str, Any]) -> List[str]:
+        """Dry-run a plan from game_state and keep only the moves that are safe to play.
+
+        The plan is cut before the first move that hits a wall or the body,
+        and after the move that eats the food, since the rest was planned
+        without knowing where the next food will appear.
+        """
+        engine = SnakeEngine.from_game_state(game_state)
+        for count, move in enumerate(moves):
+            for _ in range(self.ticks_per_move):
+                event = engine.step(move)
+                if event:
+                    break
+            if event in (HIT_WALL, HIT_BODY):
+                kept = moves[:count]
+            elif event == ATE_FOOD:
+                kept = moves[:count + 1]
+            else:
+                continue
+            if len(kept) < len(moves):
+                self.plans_truncated += 1
+            return kept
+        return moves
+
+    def collect_plan(self):
+        """Move a finished background request into ready_plan"""
+        if not self.pending or not self.pending[0].done():
+            return
+        future, origin = self.pending
+        self.pending = None
+        try:
+            moves = future.result()
+        except Exception as e:
+            print(f"Plan request failed: {e}")
+            return
+        if moves:
+            self.plans_received += 1
+            self.ready_plan = (origin, moves)
+
+    def reconcile(self, origin, moves: List[str], game_state: Dict[str, Any]) -> List[str]:
+        """Fit a plan made for origin onto the live state.
+
+        Plans for food that has since been eaten are dropped. Otherwise the
+        plan is validated from the live state, so a snake that drifted while
+        the request was in flight still gets the safe part of it.
+        """
+        live = self.origin_of(game_state)
+        if origin[3:] != live[3:]:
+            self.plans_discarded += 1
+            return []
+
+        moves = self.validate(moves, game_state)
+        if moves and origin != live:
+            self.plans_reconciled += 1
+        elif not moves:
+            self.plans_discarded += 1
+        return moves
+
+    def cached_plan(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        return self.cache.get(game_state) if self.cache else None
+
+    def fetch_plan(self, game_state: Dict[str, Any]) -> Optional[List[str]]:
+        """Ask the provider for a plan and remember the answer in the cache"""
+        start = time.perf_counter()
+        moves = self.request_plan(game_state)
+        if self.cadence:
+            self.cadence.observe_latency(time.perf_counter() - start)
+        if moves and self.cache:
+            self.cache.put(game_state, moves)
+        return moves
+
+    def start_request(self, game_state: Dict[str, Any], lead: Optional[int] = None):
+        moves = self.cached_plan(game_state)
+        if moves:
+            self.ready_plan = (self.origin_of(game_state), moves)
+            return
+        if self.cadence and lead is not None:
+            self.cadence.observe_request(lead)
+        future = self.executor.submit(self.fetch_plan, game_state)
+        self.pending = (future, self.origin_of(game_state))
+
+    def project(self, game_state: Dict[str, Any], moves: List[str]) -> Optional[Dict[str, Any]]:
+        """Predict the state the snake will be in once the given moves are used up.
+
+        Returns None when the moves eat the food: where it respawns isn't
+        known yet, so the request waits for the first tick after the meal.
+        """
+        if not moves:
+            # The request outlives this tick, so detach it from the engine
+            return as_game_state(game_state)
+        engine = SnakeEngine.from_game_state(game_state)
+        for move in moves:
+            for _ in range(self.ticks_per_move):
+                if engine.step(move) == ATE_FOOD:
+                    return None
+        return engine.to_game_state()
+
+    def origin_of(self, game_state: Dict[str, Any]):
+        head = game_state["snake_head"]
+        food = game_state["food_position"]
+        return (head["x"], head["y"], round(game_state["current_direction"]) % 360,
+                food["x"], food["y"])
+
+    def plan_stats(self) -> str:
+        return (f"{self.plans_received} received, {self.plans_reconciled} reconciled, "
+                f"{self.plans_truncated} truncated, {self.plans_discarded} discarded, "
+                f"{self.queues_invalidated} queues dropped for new food, "
+                f"{self.spare_moves_used} spare moves used, "
+                f"{self.requests_held} requests held until the food respawned")
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.cache:
+            self.cache.save()
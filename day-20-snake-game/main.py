@@ -1,46 +1,70 @@
-from turtle import Screen
-import time
+import argparse
+import os
+import sys
+from engine import SnakeEngine, GRID_SIZE, ATE_FOOD, HIT_WALL, HIT_BODY
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.keys import HeldKeys
+from gamekit.loop import FixedTimestepLoop
+from gamekit.render import add_render_arguments, backend_from_args
+from gamekit.replay import ReplayRecorder, new_seed
 from snake import Snake
 from food import Food
 from score import Scoreboard
 
-WALL_DISTANCE = 295
+TICK_RATE = 10
+
+parser = argparse.ArgumentParser(description="Play Snake")
+parser.add_argument("--seed", type=int, default=None, help="RNG seed for food placement")
+parser.add_argument("--record", default=None, help="write a replay log of the game here")
+parser.add_argument("--speed", type=float, default=TICK_RATE, help="ticks per second (0: as fast as possible)")
+add_render_arguments(parser)
+args = parser.parse_args()
+seed = args.seed if args.seed is not None else new_seed()
+recorder = None
+if args.record:
+    recorder = ReplayRecorder(args.record, "snake", seed, {"width": GRID_SIZE, "height": GRID_SIZE})
 
-screen = Screen()
+screen = backend_from_args(args).screen()
 screen.setup(width=600, height=600)
 screen.bgcolor("black")
 screen.title("Snake Game")
 screen.tracer(0)
 
-snake = Snake()
-food = Food()
-scoreboard = Scoreboard()
+engine = SnakeEngine(seed=seed, recorder=recorder)
+snake = Snake(engine)
+food = Food(engine)
+scoreboard = Scoreboard(engine)
 
 screen.listen()
-screen.onkey(snake.up, "Up")
-screen.onkey(snake.down, "Down")
-screen.onkey(snake.left, "Left")
-screen.onkey(snake.right, "Right")
+keys = HeldKeys(screen, ["Up", "Down", "Left", "Right"])
+turns = {"Up": snake.up, "Down": snake.down, "Left": snake.left, "Right": snake.right}
 
-game_is_on = True
-while game_is_on:
-    screen.update()
-    time.sleep(0.1)
-    snake.move()
 
-    if snake.head.distance(food) < 15:
+def update():
+    for _, key, pressed in keys.changes:
+        if pressed:
+            turns[key]()
+    event = engine.step()
+
+    if event == ATE_FOOD:
         food.refresh()
         scoreboard.update_score()
-        snake.extend()
 
-    if snake.head.xcor() > WALL_DISTANCE or snake.head.xcor() < -WALL_DISTANCE or snake.head.ycor() > WALL_DISTANCE or snake.head.ycor() < -WALL_DISTANCE:
-        game_is_on = False
+    if event in (HIT_WALL, HIT_BODY):
+        loop.stop()
         scoreboard.game_over()
 
-    for segment in snake.segments[1:]:
-        if snake.head.distance(segment) < 10:
-            game_is_on = False
-            scoreboard.game_over()
 
+def render():
+    snake.render()
+    screen.update()
+
+
+loop = FixedTimestepLoop(args.speed, update, render, keys=keys)
+render()
+loop.run()
+if recorder:
+    recorder.close()
 
 screen.exitonclick()
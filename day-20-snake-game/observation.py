@@ -0,0 +1,113 @@
+from collections.abc import Mapping
+import numpy as np
+from engine import MOVE_DISTANCE, WALL_DISTANCE
+
+LEGACY_KEYS = ("snake_head", "snake_body", "food_position", "current_direction", "screen_bounds")
+
+
+class ObservationBuffer:
+    """NumPy copy of a SnakeEngine body, updated one cell per step.
+
+    Body cells live in a ring buffer that is written twice, at slot i and
+    i + capacity, so the whole body is always one contiguous slice and
+    body() never copies. occupancy is a (height, width) plane with 1 on
+    every body cell, indexed [row, col] with row 0 at the bottom.
+    """
+
+    def __init__(self, width, height, body=()):
+        self.capacity = width * height
+        self.coords = np.zeros((2 * self.capacity, 2), dtype=np.int32)
+        self.occupancy = np.zeros((height, width), dtype=np.uint8)
+        self.reset(body)
+
+    def reset(self, body):
+        """Load a head-first list of cells"""
+        self.occupancy[:] = 0
+        self.head = -1
+        self.length = 0
+        for cell in reversed(body):
+            self.push_head(cell)
+
+    def push_head(self, cell):
+        self.head = (self.head + 1) % self.capacity
+        self.coords[self.head] = cell
+        self.coords[self.head + self.capacity] = cell
+        self.occupancy[cell[1], cell[0]] = 1
+        self.length += 1
+
+    def pop_tail(self, cell):
+        self.occupancy[cell[1], cell[0]] = 0
+        self.length -= 1
+
+    def body(self):
+        """(length, 2) read-only view of (col, row) cells, head first"""
+        end = self.head + self.capacity + 1
+        view = self.coords[end - self.length:end][::-1]
+        view.flags.writeable = False
+        return view
+
+    def occupancy_view(self):
+        view = self.occupancy.view()
+        view.flags.writeable = False
+        return view
+
+
+class Observation(Mapping):
+    """What a player sees for one decision, without building dicts up front.
+
+    body and occupancy are read-only views into the engine's
+    ObservationBuffer; head and food are (col, row) cells. Indexing it like
+    the legacy game_state dict ("snake_head", "snake_body", ...) builds
+    just the requested entry on first use. The views follow the engine, so
+    an Observation is only valid until the next step: use to_game_state()
+    (or as_game_state()) for anything kept longer or handed to a thread.
+    """
+
+    def __init__(self, engine):
+        buffer = engine.observation
+        self.width = engine.width
+        self.height = engine.height
+        self.body = buffer.body()
+        self.occupancy = buffer.occupancy_view()
+        self.head = engine.body[0]
+        self.food = engine.food if engine.food is not None else self.head
+        self.heading = engine.heading
+        self.legacy = {}
+
+    def to_position(self, cell):
+        return {"x": (int(cell[0]) - self.width // 2) * MOVE_DISTANCE,
+                "y": (int(cell[1]) - self.height // 2) * MOVE_DISTANCE}
+
+    def __getitem__(self, key):
+        if key not in self.legacy:
+            if key == "snake_head":
+                value = self.to_position(self.head)
+            elif key == "snake_body":
+                offset = np.array([self.width // 2, self.height // 2], dtype=np.int32)
+                positions = ((self.body[1:] - offset) * MOVE_DISTANCE).tolist()
+                value = [{"x": x, "y": y} for x, y in positions]
+            elif key == "food_position":
+                value = self.to_position(self.food)
+            elif key == "current_direction":
+                value = self.heading
+            elif key == "screen_bounds":
+                value = (self.width // 2) * MOVE_DISTANCE + WALL_DISTANCE % MOVE_DISTANCE
+            else:
+                raise KeyError(key)
+            self.legacy[key] = value
+        return self.legacy[key]
+
+    def __iter__(self):
+        return iter(LEGACY_KEYS)
+
+    def __len__(self):
+        return len(LEGACY_KEYS)
+
+    def to_game_state(self):
+        """The legacy game_state dict, detached from the engine"""
+        return {key: self[key] for key in LEGACY_KEYS}
+
+
+def as_game_state(game_state):
+    """A plain dict for either an Observation or a legacy game_state"""
+    return game_state.to_game_state() if isinstance(game_state, Observation) else game_state
@@ -0,0 +1,156 @@
+from collections import deque
+from typing import Optional, Dict, Any, List
+from engine import (MOVE_DISTANCE, WALL_DISTANCE, EMPTY, BODY_CELL, WALL_CELL, centred_cell,
+                    heading_to_direction)
+
+
+class PathfindingSnakePlayer:
+    """Local snake player that needs no network.
+
+    Each decision runs a BFS from the head to the food over a padded
+    occupancy grid, then checks that a virtual snake which followed that
+    path could still reach its own tail afterwards. Accepted paths are
+    reused tick after tick until the food moves or the snake leaves the
+    path, so most decisions are a single lookup. When no safe path to food
+    exists the snake stalls by chasing its tail, and after stalling for a
+    whole board's worth of ticks it takes the risky path rather than loop
+    forever. Call it every tick.
+    """
+
+    def __init__(self):
+        self.path = deque()  # Cells still to visit on the way to the food
+        self.path_food = None
+        self.blank_grids = {}  # Empty padded grids keyed by board size
+        self.replans = 0
+        self.stalled = 0
+
+    def get_ai_move(self, game_state: Dict[str, Any]) -> Optional[str]:
+        size = 2 * (game_state.get("screen_bounds", WALL_DISTANCE) // MOVE_DISTANCE) + 1
+        stride = size + 2
+        cells = getattr(game_state, "body", None)
+        if cells is not None:
+            # An Observation: index straight off the body view, no per-segment dicts
+            body = ((cells[:, 1] + 1) * stride + cells[:, 0] + 1).tolist()
+            food = (game_state.food[1] + 1) * stride + game_state.food[0] + 1
+        else:
+            body = [self.to_index(game_state["snake_head"], size)]
+            body += [self.to_index(seg, size) for seg in game_state["snake_body"]]
+            food = self.to_index(game_state["food_position"], size)
+        head = body[0]
+        grid = self.load_grid(size, body)
+        steps = {1: "RIGHT", -1: "LEFT", stride: "UP", -stride: "DOWN"}
+
+        if self.path and self.path[0] == head:
+            self.path.popleft()
+        if not (self.path and self.path_food == food and self.path[0] - head in steps
+                and grid[self.path[0]] == EMPTY):
+            self.path = deque(self.plan_to_food(grid, body, food, stride,
+                                                safe=self.stalled < size * size))
+            self.path_food = food
+            self.replans += 1
+
+        if self.path:
+            self.stalled = 0
+            return steps[self.path[0] - head]
+        self.stalled += 1
+        target = self.stall(grid, body, stride)
+        return steps[target - head] if target is not None else None
+
+    def to_index(self, position: Dict[str, int], size: int) -> int:
+        col, row = centred_cell(position["x"], position["y"])
+        col, row = col + size // 2, row + size // 2
+        return (row + 1) * (size + 2) + col + 1
+
+    def load_grid(self, size: int, body: List[int]) -> bytearray:
+        """Occupancy for this tick; the tail is left free since it moves away"""
+        if size not in self.blank_grids:
+            stride = size + 2
+            blank = bytearray([WALL_CELL]) * (stride * stride)
+            for row in range(1, size + 1):
+                blank[row * stride + 1:row * stride + 1 + size] = bytes(size)
+            self.blank_grids[size] = blank
+        grid = self.blank_grids[size][:]
+        for cell in body[:-1]:
+            grid[cell] = BODY_CELL
+        return grid
+
+    def bfs(self, grid: bytearray, start: int, goal: int, stride: int) -> Optional[List[int]]:
+        """Shortest path of cells from start (exclusive) to goal (inclusive)"""
+        parents = [-1] * len(grid)
+        parents[start] = start
+        frontier = deque([start])
+        pop, push = frontier.popleft, frontier.append
+        while frontier:
+            cell = pop()
+            if cell == goal:
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = parents[cell]
+                return path[::-1]
+            for neighbour in (cell + 1, cell - 1, cell + stride, cell - stride):
+                if parents[neighbour] < 0 and (grid[neighbour] == EMPTY or neighbour == goal):
+                    parents[neighbour] = cell
+                    push(neighbour)
+        return None
+
+    def distances(self, grid: bytearray, start: int, stride: int) -> List[int]:
+        """BFS distance from start to every cell, -1 where unreachable"""
+        dist = [-1] * len(grid)
+        dist[start] = 0
+        frontier = deque([start])
+        pop, push = frontier.popleft, frontier.append
+        while frontier:
+            cell = pop()
+            step = dist[cell] + 1
+            for neighbour in (cell + 1, cell - 1, cell + stride, cell - stride):
+                if dist[neighbour] < 0 and grid[neighbour] == EMPTY:
+                    dist[neighbour] = step
+                    push(neighbour)
+        return dist
+
+    def plan_to_food(self, grid: bytearray, body: List[int], food: int, stride: int,
+                     safe: bool = True) -> List[int]:
+        """Shortest path to the food, or [] if taking it would trap the snake"""
+        path = self.bfs(grid, body[0], food, stride)
+        if not path or not safe:
+            return path or []
+        # The snake after eating: path (newest first) then as much old body as fits
+        virtual = (path[::-1] + body)[:len(body) + 1]
+        after = self.load_grid(stride - 2, virtual)
+        if self.bfs(after, virtual[0], virtual[-1], stride) is None:
+            return []
+        return path
+
+    def stall(self, grid: bytearray, body: List[int], stride: int) -> Optional[int]:
+        """Pick a move that keeps the tail reachable, staying far from it to buy time"""
+        head = body[0]
+        options = [cell for cell in (head + 1, head - 1, head + stride, head - stride)
+                   if grid[cell] == EMPTY]
+        if not options:
+            return None
+        if len(body) < 3:
+            return options[0]
+
+        # One distance field from the tail-to-be serves every candidate move:
+        # a candidate is safe if some free neighbour of it is reachable
+        after = self.load_grid(stride - 2, body[:-1])
+        new_tail = body[-2]
+        after[new_tail] = EMPTY
+        from_tail = self.distances(after, new_tail, stride)
+
+        def route_length(cell):
+            reach = [from_tail[n] for n in (cell + 1, cell - 1, cell + stride, cell - stride)
+                     if from_tail[n] >= 0 and n != cell]
+            return min(reach) + 1 if reach else -1
+
+        scored = [(route_length(cell), cell) for cell in options]
+        length, best = max(scored)
+        if length >= 0:
+            return best
+        # Tail is lost either way; prefer the move with the most room
+        return max(options, key=lambda cell: sum(d >= 0 for d in self.distances(grid, cell, stride)))
+
+    def get_safe_fallback_move(self, snake_head, current_direction, wall_distance=295) -> str:
+        """get_ai_move() already avoids walls and body, so just keep going"""
+        return heading_to_direction(current_direction)
@@ -0,0 +1,140 @@
+"""Token-compact prompts for the LLM snake players.
+
+The static rules live in STATIC_PROMPT, which is sent first and never
+changes. At about 280 tokens it is too short for prompt caching: Anthropic
+(cache_control) and OpenAI (automatic prefix caching) only cache prefixes
+of MIN_CACHEABLE_TOKENS or more, so the savings here come from the short
+prompts alone. Each request adds a short state block in one of two
+encodings:
+
+    grid  the whole board as ASCII rows, top row first
+    rle   the head cell plus the body as run-length coded steps
+
+Run this file to compare prompt sizes offline:
+    python prompt_encoding.py
+"""
+import re
+from typing import Dict, Any
+from engine import MOVE_DISTANCE, WALL_DISTANCE, centred_cell, heading_to_direction
+from symmetry import VECTOR_MOVES
+
+ENCODINGS = ["prose", "grid", "rle"]
+# Shortest prefix either provider will cache (claude-sonnet-4 and OpenAI alike)
+MIN_CACHEABLE_TOKENS = 1024
+
+STATIC_PROMPT = """You are an expert Snake game AI player. Plan a sequence of 10 moves to reach the food and survive.
+
+RULES:
+- The board is a square grid; positions are pixels from the centre, one cell is 20 pixels.
+- Any position beyond the wall bound in x or y is a wall. Hitting a wall or your own body ends the game.
+- You cannot reverse: while moving RIGHT you cannot move LEFT next, and so on.
+- Prefer the shortest safe path to the food, and never move into a cell you cannot get back out of.
+
+STATE FORMAT:
+head X,Y | food X,Y | dir D | bound B
+grid: one row per line from the top (largest y) down, columns from the left (smallest x).
+  H head, o body, F food, . empty
+rle: body runs from the head towards the tail, e.g. "L3 D2" means 3 cells left of the head, then 2 down.
+
+Respond with exactly 10 words separated by spaces: UP DOWN LEFT RIGHT (in the order you want to move)"""
+
+STEP_LETTERS = {vector: move[0] for vector, move in VECTOR_MOVES.items()}
+
+
+def encode_state(game_state: Dict[str, Any], encoding: str) -> str:
+    """The per-request part of a compact prompt"""
+    head = game_state["snake_head"]
+    food = game_state["food_position"]
+    bound = game_state.get("screen_bounds", WALL_DISTANCE)
+    heading = heading_to_direction(round(game_state["current_direction"]))
+    header = f"head {head['x']},{head['y']} | food {food['x']},{food['y']} | dir {heading} | bound {bound}"
+    if encoding == "grid":
+        return header + "\n" + encode_grid(game_state)
+    return header + "\nbody " + encode_body_runs(game_state)
+
+
+def encode_grid(game_state: Dict[str, Any]) -> str:
+    half = game_state.get("screen_bounds", WALL_DISTANCE) // MOVE_DISTANCE
+    size = 2 * half + 1
+    rows = [["."] * size for _ in range(size)]
+
+    def mark(position, char):
+        col, row = centred_cell(position["x"], position["y"])
+        col, row = col + half, half - row
+        if 0 <= col < size and 0 <= row < size:
+            rows[row][col] = char
+
+    for seg in game_state["snake_body"]:
+        mark(seg, "o")
+    mark(game_state["food_position"], "F")
+    mark(game_state["snake_head"], "H")
+    return "\n".join("".join(row) for row in rows)
+
+
+def encode_body_runs(game_state: Dict[str, Any]) -> str:
+    cells = [game_state["snake_head"]] + list(game_state["snake_body"])
+    runs = []
+    for previous, current in zip(cells, cells[1:]):
+        step = ((current["x"] - previous["x"]) // MOVE_DISTANCE,
+                (current["y"] - previous["y"]) // MOVE_DISTANCE)
+        letter = STEP_LETTERS.get(step, "?")
+        if runs and runs[-1][0] == letter:
+            runs[-1][1] += 1
+        else:
+            runs.append([letter, 1])
+    return " ".join(f"{letter}{count}" for letter, count in runs) or "none"
+
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d{1,3}|([^\sA-Za-z\d])\1*|\s+")
+
+
+def count_tokens(text: str) -> int:
+    """Approximate BPE token count, computed locally.
+
+    Letter runs cost about one token per 4 characters, digits come in
+    groups of up to 3, and runs of one repeated symbol (e.g. a row of empty
+    grid cells) merge about 8 to a token, roughly what GPT/Claude
+    tokenizers do. Good for comparing prompt formats, not for billing.
+    """
+    tokens = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        piece = match.group()
+        if piece.isalpha():
+            tokens += (len(piece) + 3) // 4
+        elif match.group(1):
+            tokens += (len(piece) + 7) // 8
+        elif not piece.isspace() or "\n" in piece:
+            tokens += 1
+    return tokens
+
+
+def is_cacheable(text: str) -> bool:
+    return count_tokens(text) >= MIN_CACHEABLE_TOKENS
+
+
+def main():
+    from engine import SnakeEngine
+    from pathfinding_player import PathfindingSnakePlayer
+    from ai_player import AISnakePlayer
+    from claude_player import ClaudeSnakePlayer
+
+    # Grow a snake to a realistic length so the body matters
+    engine = SnakeEngine(seed=7)
+    player = PathfindingSnakePlayer()
+    while engine.score < 40 and not engine.game_over:
+        engine.step(player.get_ai_move(engine.to_game_state()))
+    game_state = engine.to_game_state()
+
+    openai_prose = AISnakePlayer(client=object()).create_game_prompt(game_state)
+    claude_prose = ClaudeSnakePlayer(client=object()).create_game_prompt(game_state)
+    cacheable = "cacheable" if is_cacheable(STATIC_PROMPT) else f"too short to cache, needs {MIN_CACHEABLE_TOKENS}"
+    print(f"Snake length {len(engine.body)}; static prefix {count_tokens(STATIC_PROMPT)} tokens ({cacheable})")
+    print(f"  openai prose  {count_tokens(openai_prose):5d} tokens per request")
+    print(f"  claude prose  {count_tokens(claude_prose):5d} tokens per request")
+    for encoding in ("grid", "rle"):
+        print(f"  {encoding:<12}  {count_tokens(encode_state(game_state, encoding)):5d} tokens per request "
+              f"(plus the static prefix)")
+
+
+if __name__ == "__main__":
+    main()
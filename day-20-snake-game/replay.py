@@ -0,0 +1,87 @@
+"""Re-simulate a recorded snake game.
+
+    python replay.py game.rpl                    # headless, full CPU speed
+    python replay.py game.rpl --checksums        # one line per frame, for diffing engines
+    python replay.py game.rpl --render turtle --speed 20
+    python replay.py game.rpl --render frames --frames-dir out    # PNG per frame
+"""
+import argparse
+import os
+import sys
+import time
+import zlib
+from engine import SnakeEngine, CODE_HEADINGS, ATE_FOOD
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.replay import load_replay
+from gamekit.loop import FixedTimestepLoop
+from gamekit.render import add_render_arguments, backend_from_args
+
+
+def engine_for(replay):
+    if replay.game != "snake":
+        raise ValueError(f"Expected a snake replay, got {replay.game!r}")
+    return SnakeEngine(replay.metadata.get("width"), replay.metadata.get("height"), seed=replay.seed)
+
+
+def frames(replay):
+    """Yield (tick, event, engine) after every recorded step"""
+    engine = engine_for(replay)
+    for tick, code in enumerate(replay.inputs):
+        event = engine.step(CODE_HEADINGS[code])
+        yield tick, event, engine
+
+
+def checksum(engine):
+    state = repr((list(engine.body), engine.food, engine.heading, engine.score))
+    return zlib.crc32(state.encode())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded snake game")
+    parser.add_argument("path")
+    add_render_arguments(parser, default="none")
+    parser.add_argument("--speed", type=float, default=10, help="frames per second when rendering")
+    parser.add_argument("--checksums", action="store_true", help="print a state checksum per frame")
+    args = parser.parse_args(argv)
+
+    replay = load_replay(args.path)
+    print(f"🎞️  {len(replay.inputs)} frames, seed {replay.seed}")
+
+    if args.render == "none":
+        start = time.perf_counter()
+        engine = engine_for(replay)
+        for tick, event, engine in frames(replay):
+            if args.checksums:
+                print(f"{tick} {checksum(engine):08x}")
+        elapsed = time.perf_counter() - start
+        print(f"📊 Final Score: {engine.score} after {engine.steps} steps "
+              f"({engine.steps / elapsed if elapsed else 0:,.0f} steps/s)")
+        return
+
+    from runner import GameView
+    backend = backend_from_args(args)
+    engine = engine_for(replay)
+    view = GameView(engine, "🎞️  Snake Replay")
+    inputs = iter(replay.inputs)
+
+    def update():
+        code = next(inputs, None)
+        if code is None or engine.game_over:
+            loop.stop()
+            return
+        if engine.step(CODE_HEADINGS[code]) == ATE_FOOD:
+            view.food_eaten()
+
+    # Writing frames doesn't need to wait for the wall clock
+    loop = FixedTimestepLoop(0 if backend.headless else args.speed, update, view.update)
+    view.update()
+    loop.run()
+    if engine.game_over:
+        view.game_over()
+    print(f"📊 Final Score: {engine.score}")
+    view.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Shared game loop for the AI snake players.
+
+    python runner.py --player openai
+    python runner.py --player claude --tick 0.25
+    python runner.py --player claude --encoding grid
+    python runner.py --player hedged --hedge-delay 0.2
+    python runner.py --player pathfinding --render none --decide-every 1
+    python runner.py --player distilled --render frames --frames-dir run1
+    python runner.py --player claude --log-decisions decisions.npz
+"""
+import argparse
+import os
+import sys
+from typing import Optional, Dict, Any, Protocol
+from engine import SnakeEngine, DIRECTIONS, GRID_SIZE, WALL_DISTANCE, ATE_FOOD, HIT_WALL, HIT_BODY
+from prompt_encoding import ENCODINGS
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.loop import FixedTimestepLoop, FrameStats
+from gamekit.render import add_render_arguments, backend_from_args
+from gamekit.replay import ReplayRecorder, new_seed
+
+
+class SnakePlayer(Protocol):
+    def get_ai_move(self, game_state: Dict[str, Any]) -> Optional[str]: ...
+
+    def get_safe_fallback_move(self, snake_head, current_direction, wall_distance=295) -> str: ...
+
+
+def make_openai_player(decide_every, base_url=None, encoding="prose", hedge_delay=None):
+    """base_url is a server root, e.g. a fake_llm_server.py instance, as for every player"""
+    from ai_player import AISnakePlayer, openai_base_url
+    from decision_cache import DecisionCache
+    from cadence import AdaptiveCadence
+    return AISnakePlayer(base_url=openai_base_url(base_url), ticks_per_move=decide_every, cache=DecisionCache(),
+                         encoding=encoding, cadence=AdaptiveCadence())
+
+
+def make_claude_player(decide_every, base_url=None, encoding="prose", hedge_delay=None):
+    from claude_player import ClaudeSnakePlayer
+    from decision_cache import DecisionCache
+    from cadence import AdaptiveCadence
+    return ClaudeSnakePlayer(base_url=base_url, ticks_per_move=decide_every, cache=DecisionCache(),
+                             encoding=encoding, cadence=AdaptiveCadence())
+
+
+def make_pathfinding_player(decide_every, base_url=None, encoding="prose", hedge_delay=None):
+    from pathfinding_player import PathfindingSnakePlayer
+    return PathfindingSnakePlayer()
+
+
+def make_hedged_player(decide_every, base_url=None, encoding="prose", hedge_delay=None):
+    """OpenAI and Claude raced against each other; base_url is a fake_llm_server.py root"""
+    from ai_player import AISnakePlayer, openai_base_url
+    from claude_player import ClaudeSnakePlayer
+    from decision_cache import DecisionCache
+    from hedged_player import HedgedSnakePlayer
+    from cadence import AdaptiveCadence
+    providers = {
+        "openai": AISnakePlayer(base_url=openai_base_url(base_url), prefetch=False,
+                                encoding=encoding),
+        "claude": ClaudeSnakePlayer(base_url=base_url, prefetch=False, encoding=encoding),
+    }
+    return HedgedSnakePlayer(providers, hedge_delay, ticks_per_move=decide_every, cache=DecisionCache(),
+                             cadence=AdaptiveCadence())
+
+
+def make_distilled_player(decide_every, base_url=None, encoding="prose", hedge_delay=None):
+    from distilled_player import DistilledSnakePlayer
+    return DistilledSnakePlayer()
+
+
+# name: (factory, display name, window title, key hint, default tick, default cadence)
+PLAYERS = {
+    "openai": (make_openai_player, "AI", "🤖 AI Snake Game - Powered by OpenAI",
+               "OPENAI_API_KEY", 0.1, 2),
+    "claude": (make_claude_player, "Claude", "🤖 Claude AI Snake Game - Powered by Anthropic",
+               "ANTHROPIC_API_KEY", 0.25, 2),
+    "hedged": (make_hedged_player, "Hedged", "🤖 Hedged AI Snake Game - OpenAI vs Claude",
+               "OPENAI_API_KEY and ANTHROPIC_API_KEY", 0.1, 2),
+    "distilled": (make_distilled_player, "Distilled", "🤖 Distilled Snake Game",
+                  None, 0.1, 1),
+    "pathfinding": (make_pathfinding_player, "Pathfinder", "🤖 Pathfinding Snake Game",
+                    None, 0.1, 1),
+}
+
+
+class NullView:
+    """Stand-in for the turtle window when running headless"""
+
+    def update(self):
+        pass
+
+    def food_eaten(self):
+        pass
+
+    def game_over(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class GameView:
+    """Draws the game through the current render backend (see gamekit.render)"""
+
+    def __init__(self, engine, title):
+        from gamekit.render import get_backend
+        from snake import Snake
+        from food import Food
+        from score import Scoreboard
+
+        self.backend = get_backend()
+        self.screen = self.backend.screen()
+        self.screen.setup(width=600, height=600)
+        self.screen.bgcolor("black")
+        self.screen.title(title)
+        self.screen.tracer(0)
+        self.snake = Snake(engine)
+        self.food = Food(engine)
+        self.scoreboard = Scoreboard(engine)
+        self.screen.listen()
+        self.screen.onkey(lambda: exit(), "space")
+
+    def update(self):
+        self.snake.render()
+        self.screen.update()
+
+    def food_eaten(self):
+        self.food.refresh()
+        self.scoreboard.update_score()
+
+    def game_over(self):
+        self.scoreboard.game_over()
+
+    def close(self):
+        if not self.backend.headless:
+            print("\n🎮 Game finished! Click anywhere to close.")
+        self.screen.exitonclick()
+
+
+def run_game(player: SnakePlayer, engine: SnakeEngine, view=None, name="AI", tick=0.0,
+             decide_every=1, fallback: Optional[SnakePlayer] = None, verbose=True,
+             max_steps=None, stats: Optional[FrameStats] = None, report=True,
+             decision_log=None) -> Dict[str, Any]:
+    """Play one game to the end and return its summary.
+
+    decision_log (e.g. a distill.DecisionLog) gets every move the player
+    itself chose, for training a distilled policy.
+    """
+    view = view or NullView()
+    stats = stats or FrameStats()
+    log = print if verbose else (lambda *args: None)
+    decisions_made = 0
+    successful_decisions = 0
+    event = None
+
+    def update():
+        nonlocal decisions_made, successful_decisions, event
+        if engine.steps % decide_every == 0:
+            game_state = engine.observe()
+            decisions_made += 1
+            log(f"🧠 {name} thinking... (Decision #{decisions_made})")
+            with stats.timer("ai"):
+                move = player.get_ai_move(game_state)
+
+            if move:
+                successful_decisions += 1
+                if decision_log:
+                    decision_log.record(game_state, move)
+                log(f"✅ {name} decides: {move}")
+            else:
+                log(f"⚠️  {name} decision failed, using safety fallback")
+                with stats.timer("fallback"):
+                    if fallback:
+                        move = fallback.get_ai_move(game_state)
+                    else:
+                        move = player.get_safe_fallback_move(
+                            game_state["snake_head"],
+                            game_state["current_direction"],
+                            WALL_DISTANCE
+                        )
+                log(f"🛡️  Fallback move: {move}")
+            if move in DIRECTIONS:
+                engine.turn(DIRECTIONS[move])
+
+        event = engine.step()
+        if event == ATE_FOOD:
+            view.food_eaten()
+            log(f"🍎 Food eaten! Score: {engine.score}")
+        if engine.game_over or (max_steps is not None and engine.steps >= max_steps):
+            loop.stop()
+
+    loop = FixedTimestepLoop(1.0 / tick if tick else 0, update, view.update,
+                             stats=stats, dump_at_exit=False)
+    view.update()
+    loop.run()
+
+    if engine.game_over:
+        view.game_over()
+    if report:
+        if event == HIT_WALL:
+            print(f"\n💥 Game Over - Hit Wall!")
+        elif event == HIT_BODY:
+            print(f"\n🐍 Game Over - Snake bit itself!")
+        rate = successful_decisions / decisions_made * 100 if decisions_made else 0.0
+        print(f"📊 Final Score: {engine.score}")
+        print(f"🤖 {name} Success Rate: {successful_decisions}/{decisions_made} ({rate:.1f}%)")
+        if hasattr(player, "plan_stats"):
+            print(f"📋 Plans: {player.plan_stats()}")
+        if getattr(player, "cadence", None):
+            print(f"⏲️  Cadence: {player.cadence.stats()}")
+        if hasattr(player, "provider_stats"):
+            print(f"🏎️  Providers: {player.provider_stats()}")
+        if getattr(player, "cache", None):
+            print(f"💾 Decision Cache: {player.cache.stats()}")
+
+    return {
+        "score": engine.score,
+        "steps": engine.steps,
+        "reason": event if engine.game_over else None,
+        "decisions": decisions_made,
+        "successful_decisions": successful_decisions,
+        "cadence": player.cadence.summary() if getattr(player, "cadence", None) else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch an AI play Snake")
+    parser.add_argument("--player", choices=sorted(PLAYERS), default="openai")
+    add_render_arguments(parser)
+    parser.add_argument("--tick", type=float, default=None,
+                        help="seconds to sleep per frame (default depends on player, 0 headless)")
+    parser.add_argument("--decide-every", type=int, default=None,
+                        help="frames between decisions (default depends on player)")
+    parser.add_argument("--fallback", choices=["safe", "pathfinding"], default="safe",
+                        help="what to do when the player has no move ready")
+    parser.add_argument("--max-steps", type=int, default=None, help="stop the game after this many frames")
+    parser.add_argument("--base-url", default=None,
+                        help="server root to send LLM requests to instead, e.g. a fake_llm_server.py "
+                             "instance (OpenAI's /v1 is added)")
+    parser.add_argument("--encoding", choices=ENCODINGS, default="prose",
+                        help="LLM prompt format: verbose prose or a compact grid/rle board")
+    parser.add_argument("--hedge-delay", type=float, default=None,
+                        help="hedged player: seconds before asking the next provider (default: all at once)")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for food placement")
+    parser.add_argument("--record", default=None, help="write a replay log of the game here")
+    parser.add_argument("--log-decisions", default=None,
+                        help="append the player's decisions to this dataset for distill.py")
+    parser.add_argument("--stats-file", default=None, help="also write frame timings here as JSON")
+    parser.add_argument("--quiet", action="store_true", help="only print the final summary")
+    args = parser.parse_args(argv)
+
+    factory, name, title, key_hint, default_tick, default_cadence = PLAYERS[args.player]
+    decide_every = args.decide_every or default_cadence
+    tick = args.tick if args.tick is not None else (default_tick if args.render == "turtle" else 0.0)
+
+    print(f"🚀 Initializing {name} Snake Player...")
+    try:
+        player = factory(decide_every, args.base_url, args.encoding, args.hedge_delay)
+        print(f"✅ {name} Player ready!")
+    except Exception as e:
+        print(f"❌ Failed to initialize {name} Player: {e}")
+        if key_hint:
+            print(f"Make sure your .env file contains {key_hint}")
+        exit(1)
+    fallback = make_pathfinding_player(1) if args.fallback == "pathfinding" else None
+
+    seed = args.seed if args.seed is not None else new_seed()
+    recorder = None
+    if args.record:
+        recorder = ReplayRecorder(args.record, "snake", seed,
+                                  {"width": GRID_SIZE, "height": GRID_SIZE, "player": args.player})
+    engine = SnakeEngine(seed=seed, recorder=recorder)
+    stats = FrameStats()
+    backend_from_args(args)
+    # NullView skips even the null backend's sprite bookkeeping
+    view = GameView(engine, title) if args.render != "none" else NullView()
+    print(f"\n🐍 {name} Snake Game Starting... (seed {seed})")
+    if args.render == "turtle":
+        print("Close the window or press space to exit.\n")
+
+    decision_log = None
+    if args.log_decisions:
+        from distill import DecisionLog
+        decision_log = DecisionLog(args.log_decisions)
+    run_game(player, engine, view, name=name, tick=tick, decide_every=decide_every,
+             fallback=fallback, verbose=not args.quiet, max_steps=args.max_steps, stats=stats,
+             decision_log=decision_log)
+    if decision_log:
+        decision_log.save()
+    if hasattr(player, "close"):
+        player.close()
+    if recorder:
+        recorder.close()
+        print(f"🎞️  Replay saved to {args.record}")
+    stats.dump(args.stats_file)
+    view.close()
+
+
+if __name__ == "__main__":
+    main()
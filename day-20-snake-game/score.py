@@ -1,20 +1,23 @@
-from turtle import Turtle
+from gamekit.render import Actor
 
 ALIGNMENT = "center"
 FONT = ("Arial", 15, "normal")
 
-class Scoreboard(Turtle):
-    def __init__(self):
+class Scoreboard(Actor):
+    def __init__(self, engine):
         super().__init__()
-        self.score = 0
+        self.engine = engine
         self.color("white")
         self.penup()
         self.goto(0, 260)
         self.hideturtle()
         self.write(f"Score: {self.score}", align=ALIGNMENT, font=FONT)
 
+    @property
+    def score(self):
+        return self.engine.score
+
     def update_score(self):
-        self.score += 1
         self.clear()
         self.write(f"Score: {self.score}", align=ALIGNMENT, font=FONT)
 
@@ -23,6 +26,6 @@ class Scoreboard(Turtle):
         self.write("GAME OVER", align=ALIGNMENT, font=FONT)
 
     def reset(self):
-        self.score = 0
+        self.engine.score = 0
         self.clear()
-        self.write(f"Score: {self.score}", align=ALIGNMENT, font=FONT)
\ No newline at end of file
+        self.write(f"Score: {self.score}", align=ALIGNMENT, font=FONT)
@@ -1,52 +1,97 @@
-from turtle import Turtle
+from collections import deque
+from engine import UP, DOWN, LEFT, RIGHT
+from gamekit.render import get_backend
 
-START_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
-MOVE_DISTANCE = 20
-UP = 90
-DOWN = 270
-LEFT = 180
-RIGHT = 0
 
 class Snake:
-    def __init__(self):
-        self.segments = []
+    """Draws a SnakeEngine body; all game rules live in the engine.
+
+    With recycle on (the default), render() only touches the cells that
+    changed since the last frame: each new head cell is drawn by taking the
+    tail turtle, or a fresh one while the snake grows, and moving it to the
+    front of the segments deque. That is one goto per tick however long the
+    snake is. Anything it can't explain that way (a reset engine, manual
+    extend() calls) falls back to redrawing every segment.
+    """
+
+    def __init__(self, engine, recycle=True):
+        self.engine = engine
+        self.recycle = recycle
+        self.segments = deque()
+        self.cells = deque()  # The engine cell each segment was last drawn at
+        self.drawn_steps = engine.steps
         self.create_snake()
-        self.head = self.segments[0]
+
+    @property
+    def head(self):
+        return self.segments[0]
 
     def create_snake(self):
-        for position in START_POSITIONS:
-            self.add_segment(position)
+        for cell in self.engine.body:
+            self.add_segment(self.engine.to_position(cell))
+            self.cells.append(cell)
 
-    def add_segment(self, position):
-        new_segment = Turtle("square")
+    def new_segment(self, position):
+        new_segment = get_backend().sprite("square")
         new_segment.color("white")
         new_segment.penup()
         new_segment.goto(position)
-        self.segments.append(new_segment)
-            
+        return new_segment
+
+    def add_segment(self, position):
+        self.segments.append(self.new_segment(position))
 
     def move(self):
-        for seg_num in range(len(self.segments) - 1, 0, -1):
-            new_x = self.segments[seg_num - 1].xcor()
-            new_y = self.segments[seg_num - 1].ycor()
-            self.segments[seg_num].goto(new_x, new_y)
-        self.head.forward(MOVE_DISTANCE)
+        event = self.engine.step()
+        self.render()
+        return event
+
+    def render(self):
+        moved = self.engine.steps - self.drawn_steps
+        self.drawn_steps = self.engine.steps
+        if not (self.recycle and self.advance(moved)):
+            self.redraw()
+        self.head.setheading(self.engine.heading)
+
+    def advance(self, moved):
+        """Recycle tail segments onto the cells the head entered; False if out of sync"""
+        body = self.engine.body
+        grow = len(body) - len(self.segments)
+        if not 0 <= grow <= moved <= len(self.segments):
+            return False
+        # Oldest new head cell first, so the newest ends up at the front
+        for i in reversed(range(moved)):
+            position = self.engine.to_position(body[i])
+            if grow:
+                segment = self.new_segment(position)
+                grow -= 1
+            else:
+                segment = self.segments.pop()
+                self.cells.pop()
+                segment.goto(position)
+            self.segments.appendleft(segment)
+            self.cells.appendleft(body[i])
+        return self.cells[0] == body[0] and self.cells[-1] == body[-1]
+
+    def redraw(self):
+        while len(self.segments) < len(self.engine.body):
+            self.extend()
+        for index, (segment, cell) in enumerate(zip(self.segments, self.engine.body)):
+            segment.goto(self.engine.to_position(cell))
+            self.cells[index] = cell
 
     def up(self):
-        if self.head.heading() != DOWN:
-            self.head.setheading(UP)
+        self.engine.turn(UP)
 
     def down(self):
-        if self.head.heading() != UP:
-            self.head.setheading(DOWN)
+        self.engine.turn(DOWN)
 
     def left(self):
-        if self.head.heading() != RIGHT:
-            self.head.setheading(LEFT)
+        self.engine.turn(LEFT)
 
     def right(self):
-        if self.head.heading() != LEFT:
-            self.head.setheading(RIGHT)
+        self.engine.turn(RIGHT)
 
     def extend(self):
         self.add_segment(self.segments[-1].position())
+        self.cells.append(self.cells[-1])
@@ -0,0 +1,71 @@
+"""Offline stand-ins for the OpenAI and Anthropic clients.
+
+They answer with a greedy plan toward the food, read back out of the
+prompt, after an optional random delay, so the full player pipeline can
+be exercised without keys or a network.
+"""
+import random
+import re
+import time
+from types import SimpleNamespace
+
+# The header line of the compact encodings: "head X,Y | food X,Y | ..."
+STATE_PATTERN = re.compile(r"head (-?\d+),(-?\d+) \| food (-?\d+),(-?\d+)")
+HEAD_PATTERN = re.compile(r"head[^\d-]*(-?\d+)[^\d-]+(-?\d+)", re.IGNORECASE)
+FOOD_PATTERN = re.compile(r"food[^\d-]*(-?\d+)[^\d-]+(-?\d+)", re.IGNORECASE)
+PLAN_LENGTH = 10
+
+
+def greedy_plan(prompt, rng=random):
+    """Ten moves that close the gap to the food, or random moves if unreadable"""
+    state = STATE_PATTERN.search(prompt)
+    if state:
+        head_x, head_y, food_x, food_y = map(int, state.groups())
+    else:
+        head = HEAD_PATTERN.search(prompt)
+        food = FOOD_PATTERN.search(prompt)
+        if not head or not food:
+            return [rng.choice(["UP", "DOWN", "LEFT", "RIGHT"]) for _ in range(PLAN_LENGTH)]
+        head_x, head_y = int(head.group(1)), int(head.group(2))
+        food_x, food_y = int(food.group(1)), int(food.group(2))
+    dx = (food_x - head_x) // 20
+    dy = (food_y - head_y) // 20
+    moves = ["RIGHT" if dx > 0 else "LEFT"] * abs(dx) + ["UP" if dy > 0 else "DOWN"] * abs(dy)
+    return (moves + ["UP"] * PLAN_LENGTH)[:PLAN_LENGTH]
+
+
+class StubClient:
+    def __init__(self, latency=0.0, seed=None):
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    def answer(self, prompt):
+        self.calls += 1
+        if self.latency:
+            # Log-normal delays with the given median give a realistic long tail
+            time.sleep(self.latency * self.rng.lognormvariate(0, 0.5))
+        return " ".join(greedy_plan(prompt, self.rng))
+
+
+class StubOpenAIClient(StubClient):
+    """Mimics OpenAI().responses.create(...).output_text"""
+
+    def __init__(self, latency=0.0, seed=None):
+        super().__init__(latency, seed)
+        self.responses = self
+
+    def create(self, model, input, **kwargs):
+        return SimpleNamespace(output_text=self.answer(input))
+
+
+class StubAnthropicClient(StubClient):
+    """Mimics anthropic.Anthropic().messages.create(...).content[0].text"""
+
+    def __init__(self, latency=0.0, seed=None):
+        super().__init__(latency, seed)
+        self.messages = self
+
+    def create(self, model, messages, **kwargs):
+        text = self.answer(messages[-1]["content"])
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
@@ -0,0 +1,29 @@
+"""Rotations and reflections of the board.
+
+A symmetry is an (a, b, c, d) matrix mapping a cell offset (x, y) to
+(a*x + b*y, c*x + d*y). The decision cache canonicalizes states over all
+eight of them; the distilled policy turns every state so the snake's
+heading points up.
+"""
+from engine import DIRECTIONS, DELTAS, UP, DOWN, LEFT, RIGHT
+
+SYMMETRIES = [
+    (1, 0, 0, 1), (0, -1, 1, 0), (-1, 0, 0, -1), (0, 1, -1, 0),
+    (-1, 0, 0, 1), (1, 0, 0, -1), (0, 1, 1, 0), (0, -1, -1, 0),
+]
+# The rotation that turns each heading to point UP
+HEADING_FRAMES = {UP: (1, 0, 0, 1), DOWN: (-1, 0, 0, -1), LEFT: (0, 1, -1, 0), RIGHT: (0, -1, 1, 0)}
+MOVE_VECTORS = {move: DELTAS[heading] for move, heading in DIRECTIONS.items()}
+VECTOR_MOVES = {vector: move for move, vector in MOVE_VECTORS.items()}
+
+
+def apply(matrix, vector):
+    a, b, c, d = matrix
+    x, y = vector
+    return (a * x + b * y, c * x + d * y)
+
+
+def inverse(matrix):
+    # Every symmetry is orthogonal, so its inverse is its transpose
+    a, b, c, d = matrix
+    return (a, c, b, d)
@@ -0,0 +1,190 @@
+"""Headless snake tournament: N seeded games per player across a process pool.
+
+    python tournament.py --games 200
+    python tournament.py --players pathfinding safe --games 1000 --max-steps 5000
+    python tournament.py --players openai claude --stub-latency 0.3
+    python tournament.py --players openai claude --server http://127.0.0.1:8765
+    python tournament.py --players openai hedged --stub-latency 0.05 --hedge-delay 0.06
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from engine import SnakeEngine
+from runner import run_game
+from ai_player import AISnakePlayer, openai_base_url
+from prompt_encoding import ENCODINGS
+from distilled_player import POLICY_FILE
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.loop import FrameStats, percentile
+
+
+class SafeFallbackPlayer:
+    """The LLM players' wall-only fallback, used as a player of its own"""
+
+    get_safe_fallback_move = AISnakePlayer.get_safe_fallback_move
+
+    def get_ai_move(self, game_state):
+        return self.get_safe_fallback_move(game_state["snake_head"], game_state["current_direction"])
+
+
+def make_cadence(options):
+    if options["fixed_cadence"]:
+        return None
+    from cadence import AdaptiveCadence
+    return AdaptiveCadence()
+
+
+def make_player(name, options):
+    """Build a player by name.
+
+    LLM players talk to an in-process stub client, or over HTTP to
+    options["server"] (a fake_llm_server.py instance) when that is set.
+    """
+    server = options["server"]
+    if name == "openai":
+        from stub_clients import StubOpenAIClient
+        client = None if server else StubOpenAIClient(options["stub_latency"], options["seed"])
+        return AISnakePlayer(client=client, base_url=openai_base_url(server),
+                             prefetch=options["prefetch"], ticks_per_move=options["decide_every"],
+                             encoding=options["encoding"], cadence=make_cadence(options))
+    if name == "claude":
+        from claude_player import ClaudeSnakePlayer
+        from stub_clients import StubAnthropicClient
+        client = None if server else StubAnthropicClient(options["stub_latency"], options["seed"])
+        return ClaudeSnakePlayer(client=client, base_url=server,
+                                 prefetch=options["prefetch"], ticks_per_move=options["decide_every"],
+                                 encoding=options["encoding"], cadence=make_cadence(options))
+    if name == "hedged":
+        from hedged_player import HedgedSnakePlayer
+        providers = {provider: make_player(provider, dict(options, prefetch=False, seed=options["seed"] * 2 + index))
+                     for index, provider in enumerate(("openai", "claude"))}
+        return HedgedSnakePlayer(providers, options["hedge_delay"], prefetch=options["prefetch"],
+                                 ticks_per_move=options["decide_every"], cadence=make_cadence(options))
+    if name == "distilled":
+        from distilled_player import DistilledSnakePlayer
+        return DistilledSnakePlayer()
+    if name == "pathfinding":
+        from pathfinding_player import PathfindingSnakePlayer
+        return PathfindingSnakePlayer()
+    if name == "safe":
+        return SafeFallbackPlayer()
+    raise ValueError(f"Unknown player {name!r}")
+
+
+# Local players decide every frame; LLM players keep their usual cadence
+DEFAULT_CADENCE = {"openai": 2, "claude": 2, "hedged": 2, "distilled": 1, "pathfinding": 1, "safe": 1}
+PLAYER_NAMES = sorted(DEFAULT_CADENCE)
+
+
+def default_players():
+    """Every player, leaving out distilled until distill.py has trained a policy"""
+    return [name for name in PLAYER_NAMES if name != "distilled" or os.path.exists(POLICY_FILE)]
+
+
+def play(name, seed, options):
+    """Run one headless game in a worker process"""
+    decide_every = options["decide_every"] or DEFAULT_CADENCE[name]
+    options = dict(options, seed=seed, decide_every=decide_every)
+    player = make_player(name, options)
+    stats = FrameStats(keep_samples=True)
+    result = run_game(player, SnakeEngine(seed=seed), decide_every=decide_every, verbose=False,
+                      max_steps=options["max_steps"], stats=stats, report=False)
+    if hasattr(player, "close"):
+        player.close()
+    result.update(name=name, seed=seed, latencies=stats.samples["ai"])
+    if hasattr(player, "provider_summary"):
+        result["providers"] = player.provider_summary()
+    return result
+
+
+def report(name, results):
+    scores = [r["score"] for r in results]
+    steps = [r["steps"] for r in results]
+    latencies = [ms for r in results for ms in r["latencies"]]
+    decision_time = sum(latencies) / 1000
+    crashes = sum(1 for r in results if r["reason"])
+    print(f"\n🏁 {name}: {len(results)} games, {crashes} crashed")
+    print(f"   score  min {min(scores)}  p25 {percentile(scores, 25)}  median {statistics.median(scores):g}"
+          f"  p75 {percentile(scores, 75)}  max {max(scores)}  mean {statistics.mean(scores):.2f}")
+    print(f"   steps  median {statistics.median(steps):g}  mean {statistics.mean(steps):.1f}  max {max(steps)}")
+    print(f"   decisions {len(latencies)}  ({len(latencies) / decision_time if decision_time else 0:,.0f}/s)")
+    print(f"   latency ms  p50 {percentile(latencies, 50):.3f}  p95 {percentile(latencies, 95):.3f}"
+          f"  p99 {percentile(latencies, 99):.3f}  max {max(latencies, default=0):.3f}")
+    cadences = [r["cadence"] for r in results if r["cadence"]]
+    if cadences:
+        horizons = Counter()
+        for cadence in cadences:
+            horizons.update(cadence["horizons"])
+        print(f"   cadence  request {statistics.mean(c['latency_ms'] for c in cadences):.1f}ms"
+              f"  plans {statistics.mean(c['plan_length'] for c in cadences):.1f} moves"
+              f"  horizons {dict(sorted(horizons.items()))}")
+    for provider in results[0].get("providers", {}):
+        summaries = [r["providers"][provider] for r in results]
+        requests = sum(s["requests"] for s in summaries)
+        wins = sum(s["wins"] for s in summaries)
+        provider_latencies = [ms for s in summaries for ms in s["latencies"]]
+        print(f"   {provider:<8} won {wins}/{requests} ({wins / requests * 100 if requests else 0:.0f}%)"
+              f"  call ms p50 {percentile(provider_latencies, 50):.1f}"
+              f"  p99 {percentile(provider_latencies, 99):.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare snake players over many seeded games")
+    parser.add_argument("--players", nargs="+", choices=PLAYER_NAMES, default=None,
+                        help="default: all of them (distilled only once a policy is trained)")
+    parser.add_argument("--games", type=int, default=100, help="games per player")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--max-steps", type=int, default=2000)
+    parser.add_argument("--decide-every", type=int, default=None)
+    parser.add_argument("--stub-latency", type=float, default=0.0,
+                        help="median seconds the stub LLM clients take to answer")
+    parser.add_argument("--server", default=None,
+                        help="base URL of a fake_llm_server.py to use instead of in-process stubs")
+    parser.add_argument("--prefetch", action="store_true",
+                        help="let LLM players plan in the background instead of blocking")
+    parser.add_argument("--hedge-delay", type=float, default=None,
+                        help="hedged player: seconds before the second provider is asked")
+    parser.add_argument("--fixed-cadence", action="store_true",
+                        help="LLM players: use the fixed prefetch threshold instead of AdaptiveCadence")
+    parser.add_argument("--encoding", choices=ENCODINGS, default="prose", help="LLM prompt format")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+    players = args.players or default_players()
+    if "distilled" in players and not os.path.exists(POLICY_FILE):
+        print("⚠️  Skipping distilled: no trained policy, run `python distill.py collect` "
+              "and `python distill.py train` first")
+        players = [name for name in players if name != "distilled"]
+    if not players:
+        return
+
+    options = {
+        "max_steps": args.max_steps,
+        "decide_every": args.decide_every,
+        "stub_latency": args.stub_latency,
+        "prefetch": args.prefetch,
+        "server": args.server,
+        "encoding": args.encoding,
+        "hedge_delay": args.hedge_delay,
+        "fixed_cadence": args.fixed_cadence,
+    }
+    seeds = range(args.seed, args.seed + args.games)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {name: [pool.submit(play, name, seed, options) for seed in seeds]
+                   for name in players}
+        results = {name: [future.result() for future in batch] for name, batch in futures.items()}
+    elapsed = time.perf_counter() - start
+
+    for name in players:
+        report(name, results[name])
+    total = sum(len(batch) for batch in results.values())
+    print(f"\n⏱️  {total} games in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
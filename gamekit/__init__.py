@@ -0,0 +1,5 @@
+"""Pieces shared by the turtle games in this repo.
+
+Each game folder is run as a script, so it puts the repo root on sys.path
+before importing from here.
+"""
@@ -0,0 +1,88 @@
+"""Keyboard state sampled once per tick instead of acted on per key event.
+
+screen.onkey() runs game code whenever Tk delivers a key, so movement
+follows the OS key-repeat rate. HeldKeys only records timestamped
+press/release events; FixedTimestepLoop(keys=...) calls poll() at the
+start of every tick, where the events are applied in order, and
+rendered() after every draw, which records how long each event took to
+reach the screen as the "input" phase of the frame stats.
+"""
+import time
+from collections import deque
+
+# A tick's up/down input fits in one byte for replays and the network: ups low, downs high
+MAX_PRESSES = 15
+
+
+def encode_input(ups, downs):
+    return min(ups, MAX_PRESSES) | min(downs, MAX_PRESSES) << 4
+
+
+def decode_input(code):
+    """(ups, downs) from an encode_input() byte"""
+    return code & 0x0F, code >> 4
+
+
+class HeldKeys:
+    """Pressed/released state for a set of keys, fed by onkeypress/onkeyrelease.
+
+    After poll(), is_down(key) is true for keys held at the end of the
+    tick and for keys released during it, so a quick tap is never lost;
+    presses(key) counts the new presses in the tick and changes lists the
+    tick's (timestamp, key, pressed) events in order. Auto-repeat is
+    ignored both as a press of a key that is already down and, as X11
+    delivers it, as a release directly followed by a press of the same key.
+    """
+
+    def __init__(self, screen, keys, clock=time.perf_counter):
+        self.clock = clock
+        self.events = deque()
+        self.held = set()
+        self.tapped = set()
+        self.pressed = {}
+        self.changes = []
+        self.unrendered = []  # Timestamps of consumed events not yet on screen
+        for key in keys:
+            screen.onkeypress(lambda key=key: self.events.append((self.clock(), key, True)), key)
+            screen.onkeyrelease(lambda key=key: self.events.append((self.clock(), key, False)), key)
+
+    def poll(self):
+        """Apply queued events; returns the (timestamp, key, pressed) events that changed a key"""
+        self.tapped.clear()
+        self.pressed.clear()
+        self.changes = changes = []
+        while self.events:
+            stamp, key, down = self.events.popleft()
+            if down == (key in self.held):
+                continue
+            if not down and self.events and self.events[0][1:] == (key, True):
+                # Auto-repeat pair: the key never really went up
+                self.events.popleft()
+                continue
+            if down:
+                self.held.add(key)
+                self.pressed[key] = self.pressed.get(key, 0) + 1
+            else:
+                self.held.discard(key)
+                self.tapped.add(key)
+            changes.append((stamp, key, down))
+            self.unrendered.append(stamp)
+        return changes
+
+    def is_down(self, key):
+        return key in self.held or key in self.tapped
+
+    def presses(self, key):
+        """New presses of key in the last tick"""
+        return self.pressed.get(key, 0)
+
+    def axis(self, negative, positive):
+        """-1, 0 or 1 from a pair of keys, e.g. axis("Down", "Up")"""
+        return self.is_down(positive) - self.is_down(negative)
+
+    def rendered(self, stats):
+        """Record input-to-render latency for every event drawn by the frame just finished"""
+        now = self.clock()
+        for stamp in self.unrendered:
+            stats.record("input", now - stamp)
+        self.unrendered.clear()
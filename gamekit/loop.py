@@ -0,0 +1,170 @@
+import atexit
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Upper edges of the histogram buckets, in milliseconds
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, float("inf"))
+
+
+def percentile(values, percent):
+    """The value percent% of the way through values, sorted (0.0 if empty)"""
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class FrameStats:
+    """Timing histograms for the phases of a frame (update, render, ai, ...).
+
+    With keep_samples on, raw timings are kept as well so exact percentiles
+    can be reported.
+    """
+
+    def __init__(self, keep_samples=False):
+        self.keep_samples = keep_samples
+        self.samples = defaultdict(list)
+        self.counts = defaultdict(lambda: [0] * len(BUCKETS_MS))
+        self.totals = defaultdict(float)
+        self.worst = defaultdict(float)
+        self.skipped_renders = 0
+        self.dropped_updates = 0
+
+    def record(self, phase, seconds):
+        ms = seconds * 1000
+        bucket = next(i for i, edge in enumerate(BUCKETS_MS) if ms <= edge)
+        self.counts[phase][bucket] += 1
+        self.totals[phase] += ms
+        self.worst[phase] = max(self.worst[phase], ms)
+        if self.keep_samples:
+            self.samples[phase].append(ms)
+
+    def percentile(self, phase, percent):
+        """Exact percentile in ms from kept samples (0.0 if there are none)"""
+        return percentile(self.samples[phase], percent)
+
+    @contextmanager
+    def timer(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def summary(self):
+        result = {}
+        for phase, counts in self.counts.items():
+            samples = sum(counts)
+            result[phase] = {
+                "samples": samples,
+                "mean_ms": self.totals[phase] / samples if samples else 0.0,
+                "max_ms": self.worst[phase],
+                "histogram_ms": {f"<={edge:g}": count for edge, count in zip(BUCKETS_MS, counts)},
+            }
+        result["skipped_renders"] = self.skipped_renders
+        result["dropped_updates"] = self.dropped_updates
+        return result
+
+    def report(self):
+        lines = ["⏱️  Frame timing (ms)"]
+        for phase, counts in self.counts.items():
+            samples = sum(counts)
+            if not samples:
+                continue
+            histogram = " ".join(f"≤{edge:g}:{count}" for edge, count in zip(BUCKETS_MS, counts) if count)
+            lines.append(f"  {phase:<8} n={samples:<7} mean={self.totals[phase] / samples:7.2f} "
+                         f"max={self.worst[phase]:7.2f}  {histogram}")
+        lines.append(f"  skipped renders: {self.skipped_renders}, dropped updates: {self.dropped_updates}")
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        print(self.report())
+        if path:
+            with open(path, "w") as file:
+                json.dump(self.summary(), file, indent=2)
+
+
+class FixedTimestepLoop:
+    """Runs update() at a fixed rate however long rendering takes.
+
+    Elapsed time goes into an accumulator that is drained one tick at a
+    time. With catch_up on, a slow frame is followed by up to max_catch_up
+    updates in a row and only the last state is rendered (frame skipping);
+    with it off, extra lag is dropped and the game slows down instead. A
+    tick_rate of 0 runs updates back to back, for headless simulation.
+    render_every=n draws at most once per n ticks, so a fast simulation
+    rate doesn't force the same render rate. With keys (a gamekit.keys.
+    HeldKeys) the keyboard is polled at the start of every tick and its
+    input-to-render latency lands in stats.
+    Timings go into stats and are printed when the process exits.
+    """
+
+    def __init__(self, tick_rate, update, render=None, catch_up=True, max_catch_up=5,
+                 stats=None, dump_at_exit=True, dump_path=None, render_every=1, keys=None):
+        self.dt = 1.0 / tick_rate if tick_rate else 0.0
+        self.update = update
+        self.render = render
+        self.render_every = max(1, render_every)
+        self.keys = keys
+        self.catch_up = catch_up
+        self.max_catch_up = max_catch_up
+        self.stats = stats or FrameStats()
+        self.running = False
+        if dump_at_exit:
+            atexit.register(self.stats.dump, dump_path)
+
+    def stop(self):
+        self.running = False
+
+    def tick(self):
+        if self.keys:
+            self.keys.poll()
+        with self.stats.timer("update"):
+            self.update()
+
+    def draw(self):
+        if self.render:
+            with self.stats.timer("render"):
+                self.render()
+            if self.keys:
+                self.keys.rendered(self.stats)
+
+    def run(self):
+        self.running = True
+        if not self.dt:
+            ticks = 0
+            while self.running:
+                self.tick()
+                ticks += 1
+                if ticks % self.render_every == 0:
+                    self.draw()
+            return
+
+        previous = time.perf_counter()
+        accumulator = 0.0
+        pending = 0  # Ticks since the last draw
+        while self.running:
+            now = time.perf_counter()
+            accumulator += now - previous
+            previous = now
+
+            updates = 0
+            limit = self.max_catch_up if self.catch_up else 1
+            while accumulator >= self.dt and self.running:
+                if updates == limit:
+                    self.stats.dropped_updates += int(accumulator / self.dt)
+                    accumulator %= self.dt
+                    break
+                self.tick()
+                accumulator -= self.dt
+                updates += 1
+
+            pending += updates
+            if pending >= self.render_every:
+                self.stats.skipped_renders += pending // self.render_every - 1
+                pending = 0
+                self.draw()
+            elif not updates:
+                time.sleep(self.dt - accumulator)
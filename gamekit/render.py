@@ -0,0 +1,478 @@
+"""Render backends, so the turtle games can run without a Tk window.
+
+Game objects get their sprite from the current backend instead of
+subclassing turtle.Turtle:
+
+    turtle  the normal Tk window
+    none    sprites keep their position, heading and looks but draw nothing
+    frames  every screen.update() is rasterized into a NumPy RGB buffer and
+            written out as a PNG sequence or one raw rgb24 file (needs
+            numpy and Pillow)
+
+A script picks one with use_backend() (or add_render_arguments() and
+backend_from_args()) before it creates any game object. Sprites support
+the part of the turtle API these games use: goto/forward/heading,
+shape/shapesize/color, penup/pendown, hideturtle, write/clear, distance.
+"""
+import atexit
+import math
+import os
+
+BACKENDS = ["turtle", "none", "frames"]
+FRAME_FORMATS = ["png", "raw"]
+
+# Outlines of turtle's built-in shapes at stretch 1, as (along, across) the
+# heading. "square" and "circle" are drawn as boxes and ellipses instead.
+SHAPES = {
+    "classic": [(0, 0), (-9, 5), (-7, 0), (-9, -5)],
+    "arrow": [(10, 0), (0, 10), (0, -10)],
+    "triangle": [(11.55, 0), (-5.77, 10), (-5.77, -10)],
+    "turtle": [(16, 0), (12, 3), (8, 8), (-2, 10), (-10, 7), (-14, 0),
+               (-10, -7), (-2, -10), (8, -8), (12, -3)],
+}
+SHAPE_SIZE = 20
+TEXT_ANCHORS = {"left": "ls", "center": "ms", "right": "rs"}
+
+_backend = None
+
+
+class Actor:
+    """Base for game objects; turtle-style calls go to self.sprite.
+
+    Subclasses call super().__init__(shape) and then use self.goto(),
+    self.xcor() etc. exactly as they did when they subclassed Turtle.
+    """
+
+    def __init__(self, shape="classic"):
+        self.sprite = get_backend().sprite(shape)
+
+    def __getattr__(self, name):
+        if name == "sprite":
+            raise AttributeError(name)
+        return getattr(self.sprite, name)
+
+
+class NullSprite:
+    """Turtle stand-in that tracks its state and draws nothing"""
+
+    def __init__(self, shape="classic"):
+        self._shape = shape
+        self.x = 0.0
+        self.y = 0.0
+        self.angle = 0.0
+        self.stretch = (1.0, 1.0)  # (across, along) the heading, like shapesize()
+        self.pen = "black"
+        self.fill = "black"
+        self.width = 1
+        self.visible = True
+        self.drawing = True
+        self.texts = []
+        self.trail = None  # Line segments drawn with the pen down, if a backend wants them
+
+    def shape(self, name=None):
+        if name is None:
+            return self._shape
+        self._shape = name
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
+        if stretch_wid is None and stretch_len is None:
+            return self.stretch + (1,)
+        wid = stretch_wid if stretch_wid is not None else self.stretch[0]
+        self.stretch = (wid, stretch_len if stretch_len is not None else wid)
+
+    turtlesize = shapesize
+
+    def color(self, *args):
+        if not args:
+            return self.pen, self.fill
+        self.pen = args[0]
+        self.fill = args[-1]
+
+    def pencolor(self, color=None):
+        if color is None:
+            return self.pen
+        self.pen = color
+
+    def fillcolor(self, color=None):
+        if color is None:
+            return self.fill
+        self.fill = color
+
+    def pensize(self, width=None):
+        if width is None:
+            return self.width
+        self.width = width
+
+    def speed(self, speed=None):
+        return 0 if speed is None else None
+
+    def penup(self):
+        self.drawing = False
+
+    def pendown(self):
+        self.drawing = True
+
+    def isdown(self):
+        return self.drawing
+
+    pu = up = penup
+    pd = down = pendown
+
+    def hideturtle(self):
+        self.visible = False
+
+    def showturtle(self):
+        self.visible = True
+
+    def isvisible(self):
+        return self.visible
+
+    ht = hideturtle
+    st = showturtle
+
+    def position(self):
+        return (self.x, self.y)
+
+    pos = position
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        if self.drawing and self.trail is not None:
+            self.trail.append((self.x, self.y, x, y, self.pen, self.width))
+        self.x, self.y = float(x), float(y)
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        self.goto(x, self.y)
+
+    def sety(self, y):
+        self.goto(self.x, y)
+
+    def forward(self, distance):
+        radians = math.radians(self.angle)
+        self.goto(self.x + distance * math.cos(radians), self.y + distance * math.sin(radians))
+
+    def backward(self, distance):
+        self.forward(-distance)
+
+    fd = forward
+    bk = back = backward
+
+    def heading(self):
+        return self.angle
+
+    def setheading(self, angle):
+        self.angle = angle % 360
+
+    seth = setheading
+
+    def left(self, angle):
+        self.setheading(self.angle + angle)
+
+    def right(self, angle):
+        self.setheading(self.angle - angle)
+
+    def home(self):
+        self.goto(0, 0)
+        self.setheading(0)
+
+    def distance(self, x, y=None):
+        if y is None:
+            x, y = x.position() if hasattr(x, "position") else x
+        return math.hypot(x - self.x, y - self.y)
+
+    def write(self, arg, move=False, align="left", font=("Arial", 8, "normal")):
+        self.texts.append((self.x, self.y, str(arg), align, font, self.pen))
+
+    def clear(self):
+        self.texts.clear()
+        if self.trail is not None:
+            self.trail.clear()
+
+
+class NullScreen:
+    """Screen stand-in: key bindings are ignored and update() draws nothing"""
+
+    def __init__(self):
+        self.width = 800
+        self.height = 600
+        self.background = "white"
+
+    def setup(self, width=800, height=600, startx=None, starty=None):
+        self.width, self.height = int(width), int(height)
+
+    def bgcolor(self, color=None):
+        if color is None:
+            return self.background
+        self.background = color
+
+    def window_width(self):
+        return self.width
+
+    def window_height(self):
+        return self.height
+
+    def title(self, title):
+        pass
+
+    def tracer(self, n=None, delay=None):
+        pass
+
+    def listen(self, xdummy=None, ydummy=None):
+        pass
+
+    def onkey(self, fun, key=None):
+        pass
+
+    onkeypress = onkeyrelease = onkey
+
+    def textinput(self, title, prompt):
+        return None
+
+    def update(self):
+        pass
+
+    def bye(self):
+        pass
+
+    exitonclick = mainloop = done = bye
+
+
+class NullBackend:
+    name = "none"
+    headless = True
+
+    def __init__(self):
+        self._screen = None
+
+    def screen(self):
+        if self._screen is None:
+            self._screen = self.create_screen()
+        return self._screen
+
+    def create_screen(self):
+        return NullScreen()
+
+    def sprite(self, shape="classic"):
+        return NullSprite(shape)
+
+
+class TurtleBackend:
+    """The real turtle window; sprites are turtle.Turtle objects"""
+    name = "turtle"
+    headless = False
+
+    def __init__(self):
+        import turtle
+
+        class TurtleSprite(turtle.Turtle):
+            def distance(self, x, y=None):
+                if isinstance(x, Actor):
+                    x = x.sprite
+                return super().distance(x, y)
+
+        self.turtle = turtle
+        self.sprite_class = TurtleSprite
+
+    def screen(self):
+        return self.turtle.Screen()
+
+    def sprite(self, shape="classic"):
+        return self.sprite_class(shape)
+
+
+class FrameScreen(NullScreen):
+    """Rasterizes every visible sprite into self.frame on each update().
+
+    Axis-aligned squares (snake segments, paddles, cars) are filled with
+    NumPy slices; other shapes, pen trails and text go through Pillow's
+    ImageDraw on top of them. Frames are written to out_dir as
+    frame_000000.png... or appended to out_dir/frames.rgb.
+    """
+
+    def __init__(self, sprites, out_dir="frames", frame_format="png"):
+        super().__init__()
+        import numpy as np
+        from PIL import Image, ImageColor, ImageDraw, ImageFont
+        self.np = np
+        self.Image, self.ImageColor, self.ImageDraw, self.ImageFont = Image, ImageColor, ImageDraw, ImageFont
+        self.sprites = sprites
+        self.out_dir = out_dir
+        self.frame_format = frame_format
+        self.frames_written = 0
+        self.raw_file = None
+        self.closed = False
+        self.colors = {}
+        self.fonts = {}
+        os.makedirs(out_dir, exist_ok=True)
+        self.setup()
+        atexit.register(self.bye)
+
+    def setup(self, width=800, height=600, startx=None, starty=None):
+        super().setup(width, height)
+        self.frame = self.np.zeros((self.height, self.width, 3), dtype=self.np.uint8)
+
+    def rgb(self, color):
+        if color not in self.colors:
+            if isinstance(color, str):
+                self.colors[color] = self.ImageColor.getrgb(color)[:3]
+            else:
+                scale = 255 if all(c <= 1 for c in color) else 1
+                self.colors[color] = tuple(int(c * scale) for c in color[:3])
+        return self.colors[color]
+
+    def font(self, font):
+        if font not in self.fonts:
+            family, size = font[0], int(font[1])
+            try:
+                self.fonts[font] = self.ImageFont.truetype(f"{family.lower()}.ttf", size)
+            except OSError:
+                self.fonts[font] = self.ImageFont.load_default(size)
+        return self.fonts[font]
+
+    def to_pixel(self, x, y):
+        return self.width / 2 + x, self.height / 2 - y
+
+    def render(self):
+        """Draw the current scene into self.frame and return it"""
+        frame = self.frame
+        frame[:] = self.rgb(self.background)
+        overlay = []
+        for sprite in self.sprites:
+            if sprite.trail:
+                overlay.append(sprite)
+            if not sprite.visible or sprite._shape == "blank":
+                if sprite.texts:
+                    overlay.append(sprite)
+                continue
+            if sprite._shape == "square" and sprite.angle % 90 == 0:
+                across, along = sprite.stretch
+                if sprite.angle % 180:
+                    across, along = along, across
+                half_w, half_h = along * SHAPE_SIZE / 2, across * SHAPE_SIZE / 2
+                px, py = self.to_pixel(sprite.x, sprite.y)
+                top, bottom = max(round(py - half_h), 0), max(round(py + half_h), 0)
+                left, right = max(round(px - half_w), 0), max(round(px + half_w), 0)
+                frame[top:bottom, left:right] = self.rgb(sprite.fill)
+                if sprite.texts:
+                    overlay.append(sprite)
+            else:
+                overlay.append(sprite)
+        if overlay:
+            image = self.Image.fromarray(frame)
+            draw = self.ImageDraw.Draw(image)
+            for sprite in overlay:
+                self.draw_overlay(draw, sprite)
+            frame[:] = self.np.asarray(image)
+        return frame
+
+    def draw_overlay(self, draw, sprite):
+        for x0, y0, x1, y1, color, width in sprite.trail or ():
+            draw.line([self.to_pixel(x0, y0), self.to_pixel(x1, y1)], fill=self.rgb(color), width=int(width))
+        if sprite.visible and not (sprite._shape == "square" and sprite.angle % 90 == 0):
+            across, along = sprite.stretch
+            fill = self.rgb(sprite.fill)
+            if sprite._shape == "circle":
+                if sprite.angle % 180:
+                    across, along = along, across
+                px, py = self.to_pixel(sprite.x, sprite.y)
+                half_w, half_h = along * SHAPE_SIZE / 2, across * SHAPE_SIZE / 2
+                draw.ellipse([px - half_w, py - half_h, px + half_w, py + half_h], fill=fill)
+            else:
+                outline = SHAPES.get(sprite._shape, [(10, 10), (-10, 10), (-10, -10), (10, -10)])
+                radians = math.radians(sprite.angle)
+                cos, sin = math.cos(radians), math.sin(radians)
+                points = []
+                for a, c in outline:
+                    a, c = a * along, c * across
+                    points.append(self.to_pixel(sprite.x + a * cos - c * sin, sprite.y + a * sin + c * cos))
+                draw.polygon(points, fill=fill)
+        for x, y, text, align, font, color in sprite.texts:
+            draw.text(self.to_pixel(x, y), text, fill=self.rgb(color), font=self.font(font),
+                      anchor=TEXT_ANCHORS.get(align, "ls"))
+
+    def update(self):
+        frame = self.render()
+        if self.frame_format == "raw":
+            if self.raw_file is None:
+                self.raw_file = open(os.path.join(self.out_dir, "frames.rgb"), "wb")
+            self.raw_file.write(frame.tobytes())
+        else:
+            path = os.path.join(self.out_dir, f"frame_{self.frames_written:06d}.png")
+            self.Image.fromarray(frame).save(path, compress_level=1)
+        self.frames_written += 1
+
+    def bye(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.raw_file:
+            self.raw_file.close()
+            print(f"🎞️  {self.frames_written} raw {self.width}x{self.height} rgb24 frames in "
+                  f"{os.path.join(self.out_dir, 'frames.rgb')}")
+        elif self.frames_written:
+            print(f"🎞️  {self.frames_written} PNG frames in {self.out_dir}")
+
+    exitonclick = mainloop = done = bye
+
+
+class FrameBufferBackend(NullBackend):
+    name = "frames"
+
+    def __init__(self, out_dir="frames", frame_format="png"):
+        super().__init__()
+        if frame_format not in FRAME_FORMATS:
+            raise ValueError(f"Unknown frame format {frame_format!r}, expected one of {FRAME_FORMATS}")
+        self.out_dir = out_dir
+        self.frame_format = frame_format
+        self.sprites = []
+
+    def create_screen(self):
+        return FrameScreen(self.sprites, self.out_dir, self.frame_format)
+
+    def sprite(self, shape="classic"):
+        sprite = NullSprite(shape)
+        sprite.trail = []
+        self.sprites.append(sprite)
+        return sprite
+
+
+def use_backend(name="turtle", out_dir="frames", frame_format="png"):
+    """Make a new backend current and return it"""
+    global _backend
+    if name == "turtle":
+        _backend = TurtleBackend()
+    elif name == "none":
+        _backend = NullBackend()
+    elif name == "frames":
+        _backend = FrameBufferBackend(out_dir, frame_format)
+    else:
+        raise ValueError(f"Unknown render backend {name!r}, expected one of {BACKENDS}")
+    return _backend
+
+
+def get_backend():
+    """The current backend, the turtle window unless use_backend() said otherwise"""
+    if _backend is None:
+        use_backend()
+    return _backend
+
+
+def add_render_arguments(parser, default="turtle"):
+    parser.add_argument("--render", choices=BACKENDS, default=default,
+                        help="turtle window, none (headless) or frames (write images)")
+    parser.add_argument("--frames-dir", default="frames", help="where --render frames writes to")
+    parser.add_argument("--frame-format", choices=FRAME_FORMATS, default="png",
+                        help="a PNG per frame, or one raw rgb24 file")
+
+
+def backend_from_args(args):
+    return use_backend(args.render, args.frames_dir, args.frame_format)
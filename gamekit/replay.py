@@ -0,0 +1,57 @@
+"""Compact binary replay logs: a header with the RNG seed, then one byte per tick.
+
+Layout (little-endian):
+    4s   magic b"RPLY"
+    B    format version
+    B    length of the game name, followed by the name in ASCII
+    q    RNG seed (signed, so any --seed from -2**63 to 2**63 - 1 fits)
+    H    length of a JSON metadata blob (board size etc.), followed by the blob
+    ...  one input byte per tick until end of file
+"""
+import json
+import random
+import struct
+from collections import namedtuple
+
+MAGIC = b"RPLY"
+VERSION = 1
+
+Replay = namedtuple("Replay", ["game", "seed", "metadata", "inputs"])
+
+
+def new_seed():
+    return random.SystemRandom().getrandbits(63)
+
+
+class ReplayRecorder:
+    def __init__(self, path, game, seed, metadata=None):
+        self.file = open(path, "wb")
+        name = game.encode("ascii")
+        blob = json.dumps(metadata or {}).encode("utf-8")
+        self.file.write(MAGIC + struct.pack("<BB", VERSION, len(name)) + name)
+        self.file.write(struct.pack("<qH", seed, len(blob)) + blob)
+        self.ticks = 0
+
+    def record(self, value):
+        self.file.write(bytes((value,)))
+        self.ticks += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def load_replay(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    version, name_length = struct.unpack_from("<BB", data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported replay version {version}")
+    offset = 6 + name_length
+    game = data[6:offset].decode("ascii")
+    seed, blob_length = struct.unpack_from("<qH", data, offset)
+    offset += 10
+    metadata = json.loads(data[offset:offset + blob_length])
+    return Replay(game, seed, metadata, data[offset + blob_length:])
@@ -0,0 +1,72 @@
+import random
+from constants import WALL_COORDINATE, BALL_RADIUS, PADDLE_HALF_WIDTH
+from engine import RIGHT
+
+# Fastest a computer paddle can move, in pixels per second
+PADDLE_MAX_SPEED = 600
+
+
+def fold(y, wall=WALL_COORDINATE):
+    """Where an unbounded y lands after bouncing between walls at ±wall"""
+    span = 2 * wall
+    y = (y + wall) % (2 * span)
+    return (y if y <= span else 2 * span - y) - wall
+
+
+def time_to_face(engine, side):
+    """Seconds until the ball's centre reaches side's paddle face, or None
+    if it is moving away from that paddle or already past it"""
+    direction = 1 if side == RIGHT else -1
+    if engine.ball_vx * direction <= 0:
+        return None
+    face_x = engine.paddle_x[side] - direction * (PADDLE_HALF_WIDTH + BALL_RADIUS)
+    time = (face_x - engine.ball_x) / engine.ball_vx
+    return time if time >= 0 else None
+
+
+def intercept_y(engine, side):
+    """The y at which the ball's centre reaches side's paddle face.
+
+    Solved in closed form: straight-line flight to the paddle plane, then
+    the wall bounces folded back into range. None if the ball won't get
+    there.
+    """
+    time = time_to_face(engine, side)
+    if time is None:
+        return None
+    return fold(engine.ball_y + engine.ball_vy * time)
+
+
+class InterceptPaddle:
+    """Computer player that moves a paddle towards the ball's intercept.
+
+    Difficulty knobs: max_speed caps how fast the paddle moves; aim_error
+    is the spread (in pixels) of a random offset drawn each time the ball
+    turns towards this paddle, so it sometimes aims off centre or misses;
+    a paddle with the ball heading away drifts back to the middle.
+    """
+
+    def __init__(self, engine, side, max_speed=PADDLE_MAX_SPEED, aim_error=0.0, seed=None):
+        self.engine = engine
+        self.side = side
+        self.max_speed = max_speed
+        self.aim_error = aim_error
+        self.rng = random.Random(seed)
+        self.offset = 0.0
+        self.incoming = False
+
+    def target(self):
+        y = intercept_y(self.engine, self.side)
+        if y is None:
+            self.incoming = False
+            return 0.0
+        if not self.incoming:
+            self.incoming = True
+            self.offset = self.rng.uniform(-self.aim_error, self.aim_error) if self.aim_error else 0.0
+        return y + self.offset
+
+    def update(self, dt):
+        """Move towards the target for dt seconds"""
+        reach = self.max_speed * dt
+        dy = self.target() - self.engine.paddle_y[self.side]
+        self.engine.move_paddle(self.side, max(-reach, min(reach, dy)))
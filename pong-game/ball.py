@@ -1,28 +1,18 @@
-from turtle import Turtle
+from gamekit.render import Actor
 
-class Ball(Turtle):
-    def __init__(self):
-        super().__init__()
-        self.shape("circle")
+class Ball(Actor):
+    """Draws the engine's ball; the physics live in engine.PongEngine"""
+
+    def __init__(self, engine):
+        super().__init__("circle")
+        self.engine = engine
         self.color("white")
         self.penup()
-        self.x_move = 10
-        self.y_move = 10
-        self.ball_speed = 0.1
-
-    def move(self):
-        new_x = self.xcor() + self.x_move
-        new_y = self.ycor() + self.y_move
-        self.goto(new_x, new_y)
-        
-        
-    def bounce_y(self):
-        self.y_move *= -1
-    def bounce_x(self):
-        self.x_move *= -1
-        self.ball_speed *= 0.9
+        self.refresh()
 
-    def reset_position(self):
-        self.goto(0, 0)
-        self.bounce_x()
+    @property
+    def ball_speed(self):
+        return self.engine.ball_speed
 
+    def refresh(self):
+        self.goto(self.engine.ball_x, self.engine.ball_y)
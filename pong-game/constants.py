@@ -3,4 +3,18 @@ PADDLE_POSITION = (340, 0)
 WALL_COORDINATE = 280 
 FONT = ("Arial", 24, "normal")
 SCOREBOARD_POSITION = (260, 260)
-SCOREBOARD_ALIGNMENT = "center"
\ No newline at end of file
+SCOREBOARD_ALIGNMENT = "center"
+
+# Physics, in pixels and seconds
+BALL_RADIUS = 10
+PADDLE_HALF_WIDTH = 10
+PADDLE_HALF_HEIGHT = 50
+PADDLE_STEP = 20
+# Speed of a paddle while its key is held
+PADDLE_SPEED = 400
+# A ball centre past this x is out
+OUT_COORDINATE = 380
+BALL_START_VELOCITY = (100, 100)
+# Each paddle hit makes the ball this much faster (the old ball_speed *= 0.9)
+SPEEDUP = 1 / 0.9
+MAX_BALL_SPEED = 2000
@@ -0,0 +1,166 @@
+import math
+import random
+from constants import (PADDLE_POSITION, WALL_COORDINATE, BALL_RADIUS, PADDLE_HALF_WIDTH,
+                       PADDLE_HALF_HEIGHT, PADDLE_STEP, OUT_COORDINATE, BALL_START_VELOCITY,
+                       SPEEDUP, MAX_BALL_SPEED)
+
+# Paddle indices; the right paddle is paddle_1 in main.py
+LEFT = 0
+RIGHT = 1
+
+# The ball never moves more than this far in one substep
+MAX_SUBSTEP_DISTANCE = BALL_RADIUS
+# Bounces resolved inside one substep before the rest of the move is dropped
+MAX_CONTACTS = 16
+# Serves leave the centre at 45 degrees, give or take this many
+SERVE_SPREAD = 25
+
+
+def sweep(x, y, dx, dy, left, bottom, right, top):
+    """Swept AABB test of a point moving by (dx, dy) against a box.
+
+    The ball is a box too, so callers grow the paddle by the ball's half
+    size and sweep the ball's centre. Returns (fraction of the move at
+    first contact, "x" or "y" for the face that was hit), or None if the
+    point doesn't enter the box during this move.
+    """
+    if dx:
+        near, far = (left, right) if dx > 0 else (right, left)
+        x_entry, x_exit = (near - x) / dx, (far - x) / dx
+    elif left <= x <= right:
+        x_entry, x_exit = -math.inf, math.inf
+    else:
+        return None
+    if dy:
+        near, far = (bottom, top) if dy > 0 else (top, bottom)
+        y_entry, y_exit = (near - y) / dy, (far - y) / dy
+    elif bottom <= y <= top:
+        y_entry, y_exit = -math.inf, math.inf
+    else:
+        return None
+
+    entry = max(x_entry, y_entry)
+    if entry > min(x_exit, y_exit) or not 0 <= entry <= 1:
+        return None
+    return entry, "x" if x_entry >= y_entry else "y"
+
+
+class PongEngine:
+    """Pong rules without any drawing, in pixels and seconds.
+
+    step(dt) advances the ball by dt seconds in substeps of at most
+    max_distance, sweeping it against both paddles so a fast ball can't
+    tunnel through. Walls and paddles are exact contact events within a
+    substep, so with the paddles standing still a single substep of any
+    length is exact too (max_distance=None). Every paddle hit multiplies the ball's speed by
+    SPEEDUP up to MAX_BALL_SPEED; a point resets it to the serve speed.
+    Serve angles come from a seeded RNG, so a seed replays the same game.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.paddle_x = (-PADDLE_POSITION[0], PADDLE_POSITION[0])
+        self.paddle_y = [float(PADDLE_POSITION[1])] * 2
+        self.scores = [0, 0]
+        self.returns = [0, 0]  # Paddle hits per side
+        self.hits = 0
+        self.rally = 0
+        self.ball_x = 0.0
+        self.ball_y = 0.0
+        self.ball_vx, self.ball_vy = (float(v) for v in BALL_START_VELOCITY)
+
+    def snapshot(self):
+        """Everything step() depends on, as an immutable value for rollback"""
+        return (self.ball_x, self.ball_y, self.ball_vx, self.ball_vy, tuple(self.paddle_y),
+                tuple(self.scores), tuple(self.returns), self.hits, self.rally, self.rng.getstate())
+
+    def restore(self, state):
+        (self.ball_x, self.ball_y, self.ball_vx, self.ball_vy, paddle_y,
+         scores, returns, self.hits, self.rally, rng_state) = state
+        self.paddle_y = list(paddle_y)
+        self.scores = list(scores)
+        self.returns = list(returns)
+        self.rng.setstate(rng_state)
+
+    @property
+    def ball_speed(self):
+        return math.hypot(self.ball_vx, self.ball_vy)
+
+    def move_paddle(self, side, dy):
+        """Move a paddle, keeping its centre between the walls"""
+        y = self.paddle_y[side] + dy
+        self.paddle_y[side] = max(-WALL_COORDINATE, min(WALL_COORDINATE, y))
+
+    def paddle_up(self, side):
+        self.move_paddle(side, PADDLE_STEP)
+
+    def paddle_down(self, side):
+        self.move_paddle(side, -PADDLE_STEP)
+
+    def reset_ball(self):
+        """Serve from the centre at the start speed, towards the player who just scored"""
+        self.ball_x = self.ball_y = 0.0
+        angle = math.radians(45 + self.rng.uniform(-SERVE_SPREAD, SERVE_SPREAD))
+        speed = math.hypot(*BALL_START_VELOCITY)
+        self.ball_vx = math.copysign(speed * math.cos(angle), -self.ball_vx)
+        self.ball_vy = math.copysign(speed * math.sin(angle), self.rng.choice((-1, 1)))
+        self.rally = 0
+
+    def step(self, dt, max_distance=MAX_SUBSTEP_DISTANCE):
+        """Advance dt seconds; returns LEFT or RIGHT if that side scored"""
+        substeps = max(1, math.ceil(self.ball_speed * dt / max_distance)) if max_distance else 1
+        for _ in range(substeps):
+            scorer = self.substep(dt / substeps)
+            if scorer is not None:
+                return scorer
+        return None
+
+    def substep(self, dt):
+        remaining = 1.0
+        for _ in range(MAX_CONTACTS):
+            dx = self.ball_vx * dt * remaining
+            dy = self.ball_vy * dt * remaining
+            contact = None
+            for side in (LEFT, RIGHT):
+                hit = sweep(self.ball_x, self.ball_y, dx, dy, *self.paddle_box(side))
+                if hit and (contact is None or hit[0] < contact[0]):
+                    contact = hit + (side,)
+            if abs(self.ball_y + dy) > WALL_COORDINATE:
+                fraction = (math.copysign(WALL_COORDINATE, dy) - self.ball_y) / dy
+                if contact is None or fraction < contact[0]:
+                    contact = (fraction, "y", None)
+            if contact is None:
+                self.ball_x += dx
+                self.ball_y += dy
+                break
+            fraction, face, side = contact
+            self.ball_x += dx * fraction
+            self.ball_y += dy * fraction
+            remaining *= 1 - fraction
+            if face == "x":
+                self.ball_vx = -self.ball_vx
+                self.hits += 1
+                self.returns[side] += 1
+                self.rally += 1
+                self.speed_up()
+            else:
+                self.ball_vy = -self.ball_vy
+
+        if abs(self.ball_x) > OUT_COORDINATE:
+            scorer = LEFT if self.ball_x > 0 else RIGHT
+            self.scores[scorer] += 1
+            self.reset_ball()
+            return scorer
+        return None
+
+    def paddle_box(self, side):
+        """A paddle grown by the ball's radius, as (left, bottom, right, top)"""
+        x, y = self.paddle_x[side], self.paddle_y[side]
+        half_w = PADDLE_HALF_WIDTH + BALL_RADIUS
+        half_h = PADDLE_HALF_HEIGHT + BALL_RADIUS
+        return x - half_w, y - half_h, x + half_w, y + half_h
+
+    def speed_up(self):
+        factor = min(SPEEDUP, MAX_BALL_SPEED / self.ball_speed)
+        self.ball_vx *= factor
+        self.ball_vy *= factor
@@ -1,58 +1,100 @@
-from turtle import Screen
-from paddle import Paddle
-from constants import PADDLE_POSITION, WALL_COORDINATE, SCOREBOARD_POSITION
+import argparse
+import os
+import sys
 import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.keys import HeldKeys
+from gamekit.loop import FixedTimestepLoop
+from gamekit.render import add_render_arguments, backend_from_args
+from paddle import Paddle
+from constants import SCOREBOARD_POSITION, PADDLE_SPEED
+from engine import PongEngine, LEFT, RIGHT
+from ai_paddle import InterceptPaddle
 from ball import Ball
 from score import Scoreboard
 
-screen = Screen()
+# Physics steps per second; rendering runs at its own, lower rate
+SIM_RATE = 120
+RENDER_RATE = 30
+
+parser = argparse.ArgumentParser(description="Play Pong")
+add_render_arguments(parser)
+parser.add_argument("--sim-rate", type=float, default=SIM_RATE, help="physics steps per second")
+parser.add_argument("--fps", type=float, default=RENDER_RATE, help="frames drawn per simulated second")
+parser.add_argument("--speed", type=float, default=1.0,
+                    help="simulated seconds per real second (0: as fast as possible)")
+parser.add_argument("--max-ticks", type=int, default=None, help="stop after this many physics steps")
+parser.add_argument("--ai", choices=["none", "left", "right", "both"], default="none",
+                    help="which paddles the computer plays")
+parser.add_argument("--seed", type=int, default=None, help="RNG seed for serve angles")
+args = parser.parse_args()
+
+screen = backend_from_args(args).screen()
 screen.title("Pong Game")
 screen.bgcolor("black")
 screen.setup(width=800, height=600)
 screen.tracer(0)
 
-paddle_1 = Paddle(PADDLE_POSITION)
-paddle_2 = Paddle((-PADDLE_POSITION[0], PADDLE_POSITION[1]))
-ball = Ball()
+engine = PongEngine(args.seed)
+computer = [InterceptPaddle(engine, side) for side, name in ((LEFT, "left"), (RIGHT, "right"))
+            if args.ai in (name, "both")]
+paddle_1 = Paddle(engine, RIGHT)
+paddle_2 = Paddle(engine, LEFT)
+ball = Ball(engine)
 score_1 = Scoreboard(SCOREBOARD_POSITION)
 score_2 = Scoreboard((-SCOREBOARD_POSITION[0], SCOREBOARD_POSITION[1]))
 
 screen.listen()
-screen.onkey(paddle_1.move_up, "Up")
-screen.onkey(paddle_1.move_down, "Down")
-screen.onkey(paddle_2.move_up, "w")
-screen.onkey(paddle_2.move_down, "s")
+keys = HeldKeys(screen, ["Up", "Down", "w", "s"])
+# Human paddles move at PADDLE_SPEED for as long as their key is held
+human = [(side, up, down) for side, up, down in ((RIGHT, "Up", "Down"), (LEFT, "w", "s"))
+         if side not in [paddle.side for paddle in computer]]
 
 screen.update()
 
 score_1.score = 0
 score_2.score = 0
 
-game_on = True
-while game_on:
-    time.sleep(0.1)
-    screen.update()
 
+ticks = 0
+dt = 1.0 / args.sim_rate
 
-    paddle_1.limit_movement()
-    paddle_2.limit_movement()
 
-    ball.move()
+def update():
+    global ticks
+    if args.max_ticks is not None and ticks >= args.max_ticks:
+        loop.stop()
+        return
+    ticks += 1
 
-    if ball.ycor() > WALL_COORDINATE or ball.ycor() < -WALL_COORDINATE:
-        ball.bounce_y()
+    for side, up, down in human:
+        engine.move_paddle(side, keys.axis(down, up) * PADDLE_SPEED * dt)
+    for paddle in computer:
+        paddle.update(dt)
+    scorer = engine.step(dt)
+    if scorer == RIGHT:
+        score_1.update_score()
+    elif scorer == LEFT:
+        score_2.update_score()
 
-   ##when the ball hits the paddle
-    if ball.distance(paddle_1) < 50 and ball.xcor() > 310 or ball.distance(paddle_2) < 50 and ball.xcor() < -310:
-        ball.bounce_x()
 
-    ###
-    if ball.xcor() > 380:
-        ball.reset_position()
-        score_2.update_score()
-    if ball.xcor() < -380:
-        ball.reset_position()
-        score_1.update_score()
+def render():
+    ball.refresh()
+    paddle_1.refresh()
+    paddle_2.refresh()
+    screen.update()
+
+
+render_every = max(1, round(args.sim_rate / args.fps))
+loop = FixedTimestepLoop(args.sim_rate * args.speed, update, render, render_every=render_every,
+                         max_catch_up=4 * render_every, keys=keys)
+start = time.perf_counter()
+loop.run()
+elapsed = time.perf_counter() - start
+print(f"🏓 {ticks} steps "
+      f"({(ticks * dt) / elapsed if elapsed else 0:.1f}x real time), {engine.hits} paddle hits, "
+      f"ball at {engine.ball_speed:.0f}px/s")
 
 
-screen.exitonclick()
\ No newline at end of file
+screen.exitonclick()
@@ -0,0 +1,137 @@
+"""UDP transport for two-player pong (see rollback.py and netplay.py).
+
+Every tick each peer sends one small datagram:
+    4s   magic b"PONG"
+    i    ack: the last tick up to which it has every input from the other side
+    I    first tick of the inputs that follow
+    B    number of input bytes, followed by them (one code per tick)
+The inputs are everything the other side hasn't acked yet, so a lost
+packet is covered by the next one and nothing is ever retransmitted.
+"""
+import heapq
+import random
+import socket
+import struct
+import time
+
+MAGIC = b"PONG"
+HEADER = struct.Struct("!4siIB")
+# Most inputs per packet; a peer further behind catches up over several
+MAX_INPUTS = 64
+
+
+def encode_packet(ack, start, codes):
+    return HEADER.pack(MAGIC, ack, start, len(codes)) + bytes(codes)
+
+
+def decode_packet(data):
+    """(ack, start tick, codes), or None for anything that isn't ours"""
+    if len(data) < HEADER.size:
+        return None
+    magic, ack, start, count = HEADER.unpack_from(data)
+    codes = data[HEADER.size:HEADER.size + count]
+    if magic != MAGIC or len(codes) != count:
+        return None
+    return ack, start, codes
+
+
+def parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class UdpTransport:
+    """Non-blocking UDP socket with optional injected latency, jitter and loss.
+
+    The impairments are applied on the sending side: a packet is dropped
+    with probability loss, otherwise held back for latency ± jitter seconds
+    (so jitter can reorder packets) and sent on a later send() or
+    receive(). clock can be swapped for a simulated one.
+    """
+
+    def __init__(self, port, peer=None, latency=0.0, jitter=0.0, loss=0.0, seed=None,
+                 clock=time.perf_counter):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.bind(("0.0.0.0", port))
+        self.peer = peer
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.outbox = []
+        self.sequence = 0
+        self.sent = 0
+        self.dropped = 0
+        self.received = 0
+
+    @property
+    def port(self):
+        return self.sock.getsockname()[1]
+
+    def send(self, data):
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+        self.sequence += 1
+        heapq.heappush(self.outbox, (self.clock() + delay, self.sequence, data))
+        self.flush()
+
+    def flush(self):
+        now = self.clock()
+        while self.outbox and self.outbox[0][0] <= now:
+            _, _, data = heapq.heappop(self.outbox)
+            try:
+                self.sock.sendto(data, self.peer)
+                self.sent += 1
+            except OSError:
+                # Nobody listening yet (ICMP port unreachable); the next packet repeats it
+                self.dropped += 1
+
+    def receive(self):
+        self.flush()
+        packets = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            self.received += 1
+            packets.append(data)
+        return packets
+
+    def stats(self):
+        return f"{self.sent} packets sent, {self.dropped} dropped, {self.received} received"
+
+    def close(self):
+        self.sock.close()
+
+
+class NetPeer:
+    """Feeds a RollbackSession from a transport and sends its local inputs"""
+
+    def __init__(self, session, transport):
+        self.session = session
+        self.transport = transport
+        self.peer_ack = -1  # The peer has every local input up to here
+
+    def poll(self):
+        for data in self.transport.receive():
+            packet = decode_packet(data)
+            if packet is None:
+                continue
+            ack, start, codes = packet
+            self.peer_ack = max(self.peer_ack, ack)
+            for offset, code in enumerate(codes):
+                self.session.add_remote_input(start + offset, code)
+        self.session.forget_local_before(self.peer_ack + 1)
+
+    def send(self):
+        session = self.session
+        local = session.inputs[session.side]
+        start = self.peer_ack + 1
+        end = min(session.tick + session.input_delay, start + MAX_INPUTS)
+        codes = [local[tick] for tick in range(start, end)]
+        self.transport.send(encode_packet(session.remote_confirmed, start, codes))
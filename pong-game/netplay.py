@@ -0,0 +1,185 @@
+"""Two-player pong over UDP with rollback.
+
+    python netplay.py --side left --port 9000 --peer 127.0.0.1:9001
+    python netplay.py --side right --port 9001 --peer 127.0.0.1:9000
+    python netplay.py --loopback --latency 0.08 --jitter 0.02 --loss 0.1
+    python netplay.py --loopback --ticks 2000 --latency 0.2 --jitter 0.1 --loss 0.5
+
+Each player runs their own copy of the game and controls one paddle with
+Up/Down (or w/s). Both copies must use the same --seed. --latency,
+--jitter and --loss add fake network trouble to the packets this side
+sends. --loopback runs two headless peers in one process over localhost
+with scripted inputs on a simulated clock, then checks that both ended
+up in exactly the state a local run of the same inputs gives.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.keys import HeldKeys, encode_input
+from gamekit.loop import FixedTimestepLoop
+from gamekit.render import add_render_arguments, backend_from_args
+from constants import SCOREBOARD_POSITION
+from engine import PongEngine, LEFT, RIGHT
+from rollback import RollbackSession, apply_input
+from netcode import UdpTransport, NetPeer, parse_address
+
+SIM_RATE = 60
+RENDER_RATE = 30
+SIDES = {"left": LEFT, "right": RIGHT}
+
+
+def play(args):
+    from paddle import Paddle
+    from ball import Ball
+    from score import Scoreboard
+
+    side = SIDES[args.side]
+    screen = backend_from_args(args).screen()
+    screen.title(f"Pong ({args.side} paddle)")
+    screen.bgcolor("black")
+    screen.setup(width=800, height=600)
+    screen.tracer(0)
+
+    engine = PongEngine(args.seed)
+    paddles = [Paddle(engine, RIGHT), Paddle(engine, LEFT)]
+    ball = Ball(engine)
+    score_1 = Scoreboard(SCOREBOARD_POSITION)
+    score_2 = Scoreboard((-SCOREBOARD_POSITION[0], SCOREBOARD_POSITION[1]))
+
+    session = RollbackSession(engine, side, 1.0 / SIM_RATE, args.input_delay, args.max_rollback)
+    transport = UdpTransport(args.port, parse_address(args.peer), args.latency, args.jitter, args.loss)
+    peer = NetPeer(session, transport)
+    screen.listen()
+    keys = HeldKeys(screen, ["Up", "Down", "w", "s"])
+
+    def update():
+        peer.poll()
+        # Like main.py, the paddle moves at PADDLE_SPEED while a key is held
+        session.advance(encode_input(keys.is_down("Up") or keys.is_down("w"),
+                                     keys.is_down("Down") or keys.is_down("s")))
+        peer.send()
+
+    def render():
+        ball.refresh()
+        for paddle in paddles:
+            paddle.refresh()
+        score_1.show(engine.scores[RIGHT])
+        score_2.show(engine.scores[LEFT])
+        screen.update()
+
+    print(f"🏓 Playing the {args.side} paddle on port {transport.port} against {args.peer}")
+    loop = FixedTimestepLoop(SIM_RATE, update, render, render_every=max(1, round(SIM_RATE / RENDER_RATE)),
+                             keys=keys)
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"📡 {session.stats()}; {transport.stats()}")
+        transport.close()
+
+
+def script(rng, ticks, press_chance=0.2):
+    """Random held keys for one side of a loopback run"""
+    codes = []
+    for _ in range(ticks):
+        if rng.random() < press_chance:
+            codes.append(encode_input(1, 0) if rng.random() < 0.5 else encode_input(0, 1))
+        else:
+            codes.append(0)
+    return codes
+
+
+def reference_run(seed, scripts, input_delay, ticks):
+    """The same inputs applied locally, with no network in between"""
+    engine = PongEngine(seed)
+    dt = 1.0 / SIM_RATE
+    for tick in range(ticks):
+        for side in (LEFT, RIGHT):
+            apply_input(engine, side, scripts[side][tick - input_delay] if tick >= input_delay else 0, dt)
+        engine.step(dt)
+    return engine.snapshot()
+
+
+def loopback(args):
+    rng = random.Random(args.seed)
+    ticks = args.ticks
+    scripts = {side: script(rng, ticks) for side in (LEFT, RIGHT)}
+    now = [0.0]
+
+    def clock():
+        return now[0]
+
+    peers = {}
+    for side in (LEFT, RIGHT):
+        session = RollbackSession(PongEngine(args.seed), side, 1.0 / SIM_RATE, args.input_delay,
+                                  args.max_rollback)
+        transport = UdpTransport(0, None, args.latency, args.jitter, args.loss, rng.getrandbits(32), clock)
+        peers[side] = NetPeer(session, transport)
+    peers[LEFT].transport.peer = ("127.0.0.1", peers[RIGHT].transport.port)
+    peers[RIGHT].transport.peer = ("127.0.0.1", peers[LEFT].transport.port)
+
+    def finished(session):
+        return (session.tick == ticks and session.remote_confirmed >= ticks - 1
+                and session.rollback_from is None)
+
+    start = time.perf_counter()
+    frames = 0
+    # Keep exchanging packets after the last tick until both sides have every input
+    while not all(finished(peer.session) for peer in peers.values()):
+        now[0] += 1.0 / SIM_RATE
+        frames += 1
+        for side, peer in peers.items():
+            peer.poll()
+            session = peer.session
+            if session.tick < ticks:
+                session.advance(scripts[side][session.tick])
+            else:
+                session.resolve()
+            peer.send()
+        if frames > 100 * ticks:
+            break
+    elapsed = time.perf_counter() - start
+
+    expected = reference_run(args.seed, scripts, args.input_delay, ticks)
+    print(f"🔁 {ticks} ticks in {frames} frames ({frames / SIM_RATE:.1f}s simulated, {elapsed:.2f}s real), "
+          f"latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f}ms, loss {args.loss:.0%}, "
+          f"input delay {args.input_delay}")
+    in_sync = True
+    for side, peer in peers.items():
+        name = "left " if side == LEFT else "right"
+        matches = peer.session.engine.snapshot() == expected
+        in_sync &= matches
+        print(f"   {name} {'✅' if matches else '❌'} {peer.session.stats()}; {peer.transport.stats()}")
+        peer.transport.close()
+    print("✅ Both peers match the local reference run" if in_sync else "❌ Desync")
+    return in_sync
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play pong against someone over UDP")
+    parser.add_argument("--side", choices=sorted(SIDES), default="left")
+    parser.add_argument("--port", type=int, default=9000, help="local UDP port")
+    parser.add_argument("--peer", default="127.0.0.1:9001", help="host:port of the other player")
+    parser.add_argument("--seed", type=int, default=0, help="must match the other player's")
+    parser.add_argument("--input-delay", type=int, default=2, help="ticks between a key press and its effect")
+    parser.add_argument("--max-rollback", type=int, default=8,
+                        help="ticks to run ahead of the other player before waiting for them")
+    parser.add_argument("--latency", type=float, default=0.0, help="extra seconds added to every packet sent")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random ± seconds on top of --latency")
+    parser.add_argument("--loss", type=float, default=0.0, help="fraction of packets to drop")
+    parser.add_argument("--loopback", action="store_true", help="run the headless two-peer test instead")
+    parser.add_argument("--ticks", type=int, default=3000, help="loopback: ticks to simulate")
+    add_render_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.loopback:
+        sys.exit(0 if loopback(args) else 1)
+    play(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,22 @@
-from turtle import Turtle
-from constants import WALL_COORDINATE
+from gamekit.render import Actor
 
 
-class Paddle(Turtle):
-    def __init__(self, position):
-        super().__init__()
-        self.shape("square")
+class Paddle(Actor):
+    def __init__(self, engine, side):
+        super().__init__("square")
+        self.engine = engine
+        self.side = side
         self.color("white")
         self.shapesize(stretch_wid=5, stretch_len=1)
         self.penup()
         self.speed("fastest")
-        self.goto(position)
+        self.refresh()
 
-    
     def move_up(self):
-        new_y = self.ycor() + 20
-        self.goto(self.xcor(), new_y)
-
-    def move_up(self):
-        new_y = self.ycor() + 20
-        self.goto(self.xcor(), new_y)
+        self.engine.paddle_up(self.side)
 
     def move_down(self):
-        new_y = self.ycor() - 20
-        self.goto(self.xcor(), new_y)
-
-    def limit_movement(self):
-        if self.ycor() > WALL_COORDINATE:
-            self.move_down()
-        if self.ycor() < -WALL_COORDINATE:
-            self.move_up()
+        self.engine.paddle_down(self.side)
 
- 
+    def refresh(self):
+        self.goto(self.engine.paddle_x[self.side], self.engine.paddle_y[self.side])
@@ -0,0 +1,120 @@
+from gamekit.keys import decode_input
+from constants import PADDLE_SPEED
+from engine import LEFT, RIGHT
+
+
+def apply_input(engine, side, code, dt):
+    """Move a paddle for one tick of an encode_input() byte (1 up or down while held)"""
+    ups, downs = decode_input(code)
+    engine.move_paddle(side, (ups - downs) * PADDLE_SPEED * dt)
+
+
+class RollbackSession:
+    """Runs a PongEngine in lockstep with a remote peer, without waiting for it.
+
+    Every tick consumes one input code per side. The local input is
+    scheduled input_delay ticks ahead, which gives it time to reach the
+    peer; when the remote input for a tick hasn't arrived, it is predicted
+    to be "no presses" and the tick runs anyway. A late input that differs
+    from the prediction rolls the engine back to the snapshot taken before
+    that tick and resimulates up to the present. The session stalls
+    instead of running more than max_rollback ticks past the last
+    confirmed remote input, which bounds both resimulation cost and
+    memory.
+    """
+
+    def __init__(self, engine, side, dt, input_delay=2, max_rollback=8):
+        self.engine = engine
+        self.side = side
+        self.remote = RIGHT if side == LEFT else LEFT
+        self.dt = dt
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.tick = 0  # Next tick to simulate
+        self.inputs = {LEFT: {}, RIGHT: {}}
+        self.predicted = {}  # Tick -> remote code the simulation assumed
+        self.snapshots = {}  # Tick -> engine state before that tick ran
+        self.remote_confirmed = -1  # Every remote input up to here has arrived
+        self.rollback_from = None
+        self.rollbacks = 0
+        self.resimulated = 0
+        self.max_depth = 0
+        self.stalls = 0
+        # Nothing is scheduled for the first input_delay ticks, so they are explicit no-ops
+        for tick in range(input_delay):
+            self.inputs[side][tick] = 0
+
+    def add_remote_input(self, tick, code):
+        remote = self.inputs[self.remote]
+        if tick <= self.remote_confirmed or tick in remote:
+            return
+        remote[tick] = code
+        while self.remote_confirmed + 1 in remote:
+            self.remote_confirmed += 1
+        if tick < self.tick and self.predicted.get(tick) != code:
+            if self.rollback_from is None or tick < self.rollback_from:
+                self.rollback_from = tick
+
+    def forget_local_before(self, tick):
+        """Drop local inputs the peer has confirmed and no resimulation needs"""
+        local = self.inputs[self.side]
+        # A rollback that resolve() hasn't run yet replays from rollback_from
+        limit = min(tick, self.tick, self.rollback_from if self.rollback_from is not None else self.tick)
+        for old in [t for t in local if t < limit and t <= self.remote_confirmed]:
+            del local[old]
+
+    def resolve(self):
+        """Apply any pending rollback, resimulating up to the current tick"""
+        if self.rollback_from is None:
+            return
+        start, self.rollback_from = self.rollback_from, None
+        depth = self.tick - start
+        self.rollbacks += 1
+        self.resimulated += depth
+        self.max_depth = max(self.max_depth, depth)
+        self.engine.restore(self.snapshots[start])
+        for tick in range(start, self.tick):
+            self.simulate(tick)
+
+    def can_advance(self):
+        return self.tick - self.remote_confirmed <= self.max_rollback
+
+    def advance(self, code):
+        """Resolve rollbacks, then schedule the local input code and run one new tick.
+
+        Returns False, without using code, while stalled waiting for the peer.
+        """
+        self.resolve()
+        if not self.can_advance():
+            self.stalls += 1
+            return False
+        self.inputs[self.side][self.tick + self.input_delay] = code
+        self.simulate(self.tick)
+        self.tick += 1
+        self.prune()
+        return True
+
+    def simulate(self, tick):
+        self.snapshots[tick] = self.engine.snapshot()
+        remote = self.inputs[self.remote].get(tick)
+        if remote is None:
+            remote = 0
+            self.predicted[tick] = remote
+        else:
+            self.predicted.pop(tick, None)
+        codes = {self.side: self.inputs[self.side].get(tick, 0), self.remote: remote}
+        # Same order on both peers, so the float maths matches
+        apply_input(self.engine, LEFT, codes[LEFT], self.dt)
+        apply_input(self.engine, RIGHT, codes[RIGHT], self.dt)
+        return self.engine.step(self.dt)
+
+    def prune(self):
+        """Forget snapshots and remote inputs no rollback can reach any more"""
+        oldest = min(self.tick, self.remote_confirmed + 1)
+        for table in (self.snapshots, self.predicted, self.inputs[self.remote]):
+            for tick in [t for t in table if t < oldest]:
+                del table[tick]
+
+    def stats(self):
+        return (f"{self.rollbacks} rollbacks ({self.resimulated} ticks resimulated, "
+                f"deepest {self.max_depth}), {self.stalls} stalled ticks")
@@ -1,7 +1,7 @@
-from turtle import Turtle
+from gamekit.render import Actor
 from constants import FONT, SCOREBOARD_ALIGNMENT
 
-class Scoreboard(Turtle):
+class Scoreboard(Actor):
     def __init__(self, position):
         super().__init__()
         self.color("white")
@@ -16,6 +16,13 @@ class Scoreboard(Turtle):
         self.score += 1
         self.write(f"Score: {self.score}", align=SCOREBOARD_ALIGNMENT, font=FONT)
 
+    def show(self, score):
+        """Display a score kept elsewhere, e.g. by a rolled-back engine"""
+        if score != self.score:
+            self.clear()
+            self.score = score
+            self.write(f"Score: {self.score}", align=SCOREBOARD_ALIGNMENT, font=FONT)
+
     def game_over(self):
         self.goto(0, 0)
         self.write("Game Over", align=SCOREBOARD_ALIGNMENT, font=FONT)
@@ -0,0 +1,132 @@
+"""Headless pong self-play for tuning the computer paddles.
+
+    python selfplay.py --rallies 20000
+    python selfplay.py --paddle-speed 400 --aim-error 40
+    python selfplay.py --left-speed 600 --right-speed 300 --workers 4
+
+Two InterceptPaddles play rally after rally across a process pool; the
+report has rally lengths (paddle hits before a miss) and each side's
+miss rate.
+
+By default the engine jumps from one event to the next: each step runs
+until the ball reaches the next paddle face (or leaves the court), after
+the paddles have had that long to move. The paddles' targets don't change
+while the ball is in flight, so this matches fixed-rate stepping (check
+with --sim-rate 120) at a few steps per rally instead of hundreds.
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.loop import percentile
+from constants import OUT_COORDINATE
+from engine import PongEngine, LEFT, RIGHT
+from ai_paddle import InterceptPaddle, PADDLE_MAX_SPEED, time_to_face
+
+# A rally still going after this many hits is stopped and counted as capped
+MAX_HITS = 200
+# Event steps run this much past the contact so it lands inside the step
+EVENT_MARGIN = 1e-3
+
+
+def time_to_event(engine):
+    """Seconds until the ball reaches a paddle face or goes out"""
+    for side in (LEFT, RIGHT):
+        time = time_to_face(engine, side)
+        if time is not None:
+            return time
+    return (math.copysign(OUT_COORDINATE, engine.ball_vx) - engine.ball_x) / engine.ball_vx
+
+
+def play_rallies(count, seed, options):
+    """Play count rallies in a worker process"""
+    engine = PongEngine(seed)
+    paddles = [InterceptPaddle(engine, LEFT, options["left_speed"], options["aim_error"], seed * 2 + 1),
+               InterceptPaddle(engine, RIGHT, options["right_speed"], options["aim_error"], seed * 2 + 2)]
+    fixed_dt = 1.0 / options["sim_rate"] if options["sim_rate"] else None
+    lengths = []
+    misses = [0, 0]
+    capped = 0
+    steps = 0
+    engine.reset_ball()
+    for _ in range(count):
+        while True:
+            if fixed_dt:
+                for paddle in paddles:
+                    paddle.update(fixed_dt)
+                scorer = engine.step(fixed_dt)
+            else:
+                dt = time_to_event(engine)
+                for paddle in paddles:
+                    paddle.update(dt)
+                scorer = engine.step(dt + EVENT_MARGIN, max_distance=None)
+            steps += 1
+            if scorer is not None:
+                lengths.append(engine.hits)
+                misses[1 - scorer] += 1
+                break
+            if engine.rally >= options["max_hits"]:
+                lengths.append(engine.hits)
+                capped += 1
+                engine.reset_ball()
+                break
+        engine.hits = 0
+    return {"lengths": lengths, "misses": misses, "returns": engine.returns, "capped": capped,
+            "steps": steps}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pit two computer paddles against each other")
+    parser.add_argument("--rallies", type=int, default=10000)
+    parser.add_argument("--paddle-speed", type=float, default=PADDLE_MAX_SPEED,
+                        help="both paddles' top speed in px/s")
+    parser.add_argument("--left-speed", type=float, default=None)
+    parser.add_argument("--right-speed", type=float, default=None)
+    parser.add_argument("--aim-error", type=float, default=0.0, help="spread of each paddle's aim in px")
+    parser.add_argument("--sim-rate", type=float, default=0,
+                        help="fixed physics steps per second (default: step from event to event)")
+    parser.add_argument("--max-hits", type=int, default=MAX_HITS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    options = {
+        "left_speed": args.left_speed or args.paddle_speed,
+        "right_speed": args.right_speed or args.paddle_speed,
+        "aim_error": args.aim_error,
+        "sim_rate": args.sim_rate,
+        "max_hits": args.max_hits,
+    }
+    workers = args.workers or os.cpu_count() or 1
+    # A few chunks per worker keeps the pool busy without much pickling
+    chunks = min(args.rallies, workers * 4)
+    sizes = [args.rallies // chunks + (i < args.rallies % chunks) for i in range(chunks)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(play_rallies, sizes, range(args.seed, args.seed + chunks),
+                                [options] * chunks))
+    elapsed = time.perf_counter() - start
+
+    lengths = [length for r in results for length in r["lengths"]]
+    steps = sum(r["steps"] for r in results)
+    capped = sum(r["capped"] for r in results)
+    print(f"🏓 {len(lengths)} rallies in {elapsed:.2f}s ({len(lengths) / elapsed:,.0f}/s, "
+          f"{steps / elapsed:,.0f} steps/s, {workers} workers)")
+    print(f"   rally hits  min {min(lengths)}  median {statistics.median(lengths):g}"
+          f"  p90 {percentile(lengths, 90)}  max {max(lengths)}  mean {statistics.mean(lengths):.1f}"
+          f"  capped {capped}")
+    for side, name in ((LEFT, "left"), (RIGHT, "right")):
+        misses = sum(r["misses"][side] for r in results)
+        returns = sum(r["returns"][side] for r in results)
+        chances = misses + returns
+        print(f"   {name:<5} speed {options[name + '_speed']:g}px/s  missed {misses}/{chances}"
+              f" ({misses / chances * 100 if chances else 0:.2f}%)")
+
+
+if __name__ == "__main__":
+    main()
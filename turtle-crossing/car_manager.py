@@ -1,32 +1,69 @@
 import random
-from turtle import Turtle
+from gamekit.render import get_backend
 
 COLORS = ["red", "orange", "yellow", "green", "blue", "purple"]
 STARTING_MOVE_DISTANCE = 5
 MOVE_INCREMENT = 10
+# A car whose centre is past this x has fully left the screen
+OFFSCREEN_X = -320
+# Most cars on the road at once; spawns beyond this are skipped
+MAX_CARS = 40
 
 
 class CarManager:
-    def __init__(self):
+    """Spawns and moves the traffic, reusing cars that have driven off screen.
+
+    all_cars holds only the cars on the road. A car that leaves the screen
+    is hidden and parked, and the next spawn takes a parked car before
+    building a new sprite, so the number of sprites stops growing once the
+    traffic reaches its steady state.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
         self.all_cars = []
+        self.parked = []
         self.car_speed = STARTING_MOVE_DISTANCE
+        self.built = 0
+        self.reused = 0
+        self.skipped = 0
+        self.peak = 0
+
     def create_car(self):
-        random_chance = random.randint(1, 6)
+        random_chance = self.rng.randint(1, 6)
         if random_chance == 1:
-            new_car = Turtle("square")
-            new_car.shapesize(stretch_wid=1, stretch_len=2)
-            new_car.penup()
-            new_car.color(random.choice(COLORS))
-            new_car.goto(300, random.randint(-250, 250))
+            # Drawn even when capped, so a seed always gives the same traffic
+            color = self.rng.choice(COLORS)
+            y = self.rng.randint(-250, 250)
+            if len(self.all_cars) >= MAX_CARS:
+                self.skipped += 1
+                return
+            if self.parked:
+                new_car = self.parked.pop()
+                self.reused += 1
+            else:
+                new_car = get_backend().sprite("square")
+                new_car.shapesize(stretch_wid=1, stretch_len=2)
+                new_car.penup()
+                self.built += 1
+            new_car.color(color)
+            new_car.goto(300, y)
+            new_car.showturtle()
             self.all_cars.append(new_car)
-
+            self.peak = max(self.peak, len(self.all_cars))
 
     def move_cars(self):
         for car in self.all_cars:
             car.backward(self.car_speed)
+        # Every car moves at the same speed, so they leave in the order they came
+        while self.all_cars and self.all_cars[0].xcor() < OFFSCREEN_X:
+            car = self.all_cars.pop(0)
+            car.hideturtle()
+            self.parked.append(car)
 
     def level_up(self):
-        self.car_speed += MOVE_INCREMENT    
-
-
+        self.car_speed += MOVE_INCREMENT
 
+    def stats(self):
+        return (f"{self.built} cars built, {self.reused} reused, {len(self.all_cars)} on the road, "
+                f"{len(self.parked)} parked, peak {self.peak}, {self.skipped} spawns skipped at the cap")
@@ -1,29 +1,71 @@
-import time
-from turtle import Screen
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gamekit.keys import HeldKeys, encode_input, decode_input
+from gamekit.loop import FixedTimestepLoop
+from gamekit.render import add_render_arguments, backend_from_args
+from gamekit.replay import ReplayRecorder, load_replay, new_seed
 from player import Player
 from car_manager import CarManager  
 from scoreboard import Scoreboard
 
-screen = Screen()
+TICK_RATE = 10
+
+parser = argparse.ArgumentParser(description="Play Turtle Crossing")
+parser.add_argument("--seed", type=int, default=None, help="RNG seed for car traffic")
+parser.add_argument("--record", default=None, help="write a replay log of the game here")
+parser.add_argument("--replay", default=None, help="play back a replay log instead of the keyboard")
+parser.add_argument("--speed", type=float, default=TICK_RATE, help="ticks per second (0: as fast as possible)")
+add_render_arguments(parser)
+args = parser.parse_args()
+
+replay = load_replay(args.replay) if args.replay else None
+if replay:
+    seed = replay.seed
+else:
+    seed = args.seed if args.seed is not None else new_seed()
+recorder = ReplayRecorder(args.record, "turtle-crossing", seed) if args.record else None
+inputs = iter(replay.inputs) if replay else None
+
+screen = backend_from_args(args).screen()
 screen.setup(width=600, height=600)
 screen.tracer(0)
 
 player = Player()   
-car_manager = CarManager()
+car_manager = CarManager(seed)
 scoreboard = Scoreboard()
 
 screen.listen()
-screen.onkey(player.move_up, "Up")
-screen.onkey(player.move_down, "Down")
+keys = None if replay else HeldKeys(screen, ["Up", "Down"])
+
+
+def moves(key):
+    """Steps this tick: one while the key is held, or one per tap"""
+    return max(keys.presses(key), keys.is_down(key))
+
 
 screen.update()
 
 scoreboard.update_scoreboard()
 
-game_is_on = True
-while game_is_on:
-    time.sleep(0.1)
-    screen.update()
+
+def update():
+    if replay:
+        code = next(inputs, None)
+        if code is None:
+            loop.stop()
+            return
+    else:
+        code = encode_input(moves("Up"), moves("Down"))
+    if recorder:
+        recorder.record(code)
+    ups, downs = decode_input(code)
+    for _ in range(ups):
+        player.move_up()
+    for _ in range(downs):
+        player.move_down()
 
     car_manager.create_car()
     car_manager.move_cars()
@@ -36,9 +78,16 @@ while game_is_on:
 
     for car in car_manager.all_cars:
         if car.distance(player) < 20:
-            game_is_on = False
+            loop.stop()
             scoreboard.game_over()
+            break
+
 
+loop = FixedTimestepLoop(args.speed, update, screen.update, keys=keys)
+loop.run()
+if recorder:
+    recorder.close()
+print(f"🚗 {car_manager.stats()}")
 
 
-screen.exitonclick()
\ No newline at end of file
+screen.exitonclick()
@@ -1,4 +1,4 @@
-from turtle import Turtle
+from gamekit.render import Actor
 
 
 STARTING_POSITION = (0, -280)
@@ -6,10 +6,9 @@ MOVE_DISTANCE = 10
 FINISH_LINE_Y = 280
 
 
-class Player(Turtle):   
+class Player(Actor):   
     def __init__(self):
-        super().__init__()
-        self.shape("turtle")
+        super().__init__("turtle")
         self.penup()
         self.go_to_start()
         self.setheading(90)
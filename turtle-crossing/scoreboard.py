@@ -1,9 +1,9 @@
-from turtle import Turtle
+from gamekit.render import Actor
 
 FONT = ("Courier", 24, "normal")
 
 
-class Scoreboard(Turtle):
+class Scoreboard(Actor):
     def __init__(self):
         super().__init__()
         self.hideturtle()